@@ -6,12 +6,27 @@ Run: python main.py
 
 import os
 import json
+import queue
+import atexit
+from functools import lru_cache
 import logging
 import logging.handlers
+from concurrent.futures import wait
 from dotenv import load_dotenv
 import google.generativeai as genai
 from mnemosyne import MnemosyneEngine
 
+# orjson is 3-5x faster than stdlib json on the per-turn log entry.
+# The fallback emits the same compact UTF-8 form.
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    def _dumps(obj) -> str:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
 # Logging Setup
 
 _log_handler = logging.handlers.RotatingFileHandler(
@@ -23,13 +38,29 @@ _log_handler = logging.handlers.RotatingFileHandler(
 )
 _log_handler.setFormatter(logging.Formatter("%(message)s"))
 
+# The rotating file handler runs on a QueueListener thread; the chat loop
+# only enqueues records, so disk writes and rotation stay off the turn path.
+_log_queue    = queue.Queue(-1)
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, _log_handler, respect_handler_level=True
+)
+_log_listener.start()
+atexit.register(_log_listener.stop)   # drains remaining records on exit
+
 logger = logging.getLogger("mnemosyne")
 logger.setLevel(logging.INFO)
-logger.addHandler(_log_handler)
+logger.addHandler(logging.handlers.QueueHandler(_log_queue))
 
 
 def log_turn(result):
     """Writes one JSONL line per turn with full memory audit trail."""
+    # Nothing below is materialised unless the record would be emitted.
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    # Memory ops run in the background; wait so memories_added/evicted
+    # are in the log. The response has already been shown to the user.
+    if result.memory_ops is not None:
+        wait([result.memory_ops], timeout=5.0)
     entry = {
         "turn":               result.turn_number,
         "user_input":         result.user_message,
@@ -39,7 +70,7 @@ def log_turn(result):
         "memories_evicted":   result.evicted,
         "latency_ms":         result.latency_ms,
     }
-    logger.info(json.dumps(entry))
+    logger.info(_dumps(entry))
 
 load_dotenv()
 
@@ -61,16 +92,29 @@ genai.configure(api_key=API_KEY)
 
 #  Gemini Wrapper
 
-def gemini_wrapper(system_prompt: str, user_message: str, history: list) -> str:
+@lru_cache(maxsize=16)
+def _make_model(system_prompt: str) -> genai.GenerativeModel:
+    """
+    GenerativeModel per distinct system prompt. The model object holds no
+    chat state (start_chat() returns a fresh session), so turns whose memory
+    block didn't change can safely reuse it.
+    """
+    return genai.GenerativeModel(
+        model_name=MODEL_ID,
+        system_instruction=system_prompt,
+    )
+
+
+def gemini_wrapper(system_prompt: str, user_message: str, history) -> str:
     """
     Bridges the Mnemosyne Engine with Google's Gemini API.
 
     Args:
         system_prompt: Dynamic prompt from Mnemosyne — contains the
-                       <memory_context> block. Changes every turn, so
-                       GenerativeModel must be created per-call.
+                       <memory_context> block. Models are cached per
+                       distinct prompt via _make_model().
         user_message:  Current message from the user.
-        history:       List of previous turns as dicts:
+        history:       Previous turns (list) as alternating user/assistant dicts:
                        [{'role': 'user'|'assistant', 'content': '...'}, ...]
                        The engine appends the CURRENT turn to history AFTER
                        calling this function, so history never includes the
@@ -78,27 +122,23 @@ def gemini_wrapper(system_prompt: str, user_message: str, history: list) -> str:
                        Gemini's start_chat(history=...) + send_message().
     """
 
-    # Must be created per-call: system_instruction contains the dynamic
-    # memory block which is different on every turn.
-    model = genai.GenerativeModel(
-        model_name=MODEL_ID,
-        system_instruction=system_prompt,
-    )
-    gemini_history = []
-    for turn in history:
-        # FIX WARN-4: skip error responses so they do not pollute history
-        if turn["content"].startswith("[Gemini API Error"):
-            continue
-        role = "model" if turn["role"] == "assistant" else "user"
-        gemini_history.append({
-            "role":  role,
+    # system_instruction contains the dynamic memory block, so the model is
+    # keyed on the full prompt; unchanged memory blocks hit the cache.
+    model = _make_model(system_prompt)
+    # FIX WARN-4: skip error responses so they do not pollute history.
+    # History is whole user/assistant pairs, so drop the failed reply together
+    # with its user message — keeps roles alternating and ending on "model"
+    # in a single pass.
+    pairs = zip(*[iter(history)] * 2)
+    gemini_history = [
+        {
+            "role":  "model" if turn["role"] == "assistant" else "user",
             "parts": [turn["content"]],
-        })
-
-    # Ensure history strictly alternates and ends on model turn.
-    # If an error was filtered and left history in a bad shape, trim the tail.
-    while gemini_history and gemini_history[-1]["role"] != "model":
-        gemini_history.pop()
+        }
+        for user_turn, model_turn in pairs
+        if not model_turn["content"].startswith("[Gemini API Error")
+        for turn in (user_turn, model_turn)
+    ]
 
     chat = model.start_chat(history=gemini_history)
 
@@ -111,7 +151,7 @@ def gemini_wrapper(system_prompt: str, user_message: str, history: list) -> str:
         # Return a clearly prefixed string so the engine and caller can detect
         # it is an error, not a real response.
         error_msg = f"[Gemini API Error: {str(e)}]"
-        logger.error(json.dumps({"error": str(e), "type": type(e).__name__}))
+        logger.error(_dumps({"error": str(e), "type": type(e).__name__}))
         return error_msg
 
 
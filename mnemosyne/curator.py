@@ -8,11 +8,13 @@ Operations:
   DELETE → direct contradiction of existing fact
   NOOP   → duplicate or irrelevant
 
-Also runs the heat decay pass each turn.
+Also runs the heat decay pass every DECAY_INTERVAL turns.
 """
 
 import json
 import re
+import time
+from typing import Optional
 from .models import MemoryObject, MemoryType, CuratorOp, CuratorDecision, MemoryStatus
 from .memory_store import MemoryStore
 
@@ -21,12 +23,22 @@ from .memory_store import MemoryStore
 
 SIMILARITY_FOR_CONFLICT   = 0.55   # score above this → run conflict/duplicate checks
 SIMILARITY_FOR_DUPLICATE  = 0.75   # score above this AND same value → NOOP
+SEMANTIC_NEIGHBORS        = 3      # existing memories compared per candidate
 
-NON_CONTRADICTION_PAIRS = [
+# Decay pass cadence. Each pass catches up on the turns it skipped, so
+# total decay is unchanged; eviction/status just lag by < DECAY_INTERVAL turns.
+DECAY_INTERVAL            = 10
+
+_NUM_RE = re.compile(r'\d+')
+# Opening ```/```json fence at the start, closing ``` at the end.
+_FENCE_RE = re.compile(r"^```(?:json)?\s*|\s*```$")
+
+# frozenset of frozensets → O(1) hashed membership test per comparison
+NON_CONTRADICTION_PAIRS = frozenset(frozenset(p) for p in [
     {"vegetarian", "vegan"},
     {"vegan", "plant-based"},
     {"vegetarian", "plant-based"},
-]
+])
 
 
 # Curator Agent
@@ -47,42 +59,116 @@ class Curator:
         Process a list of MemoryObject candidates from Sentinel.
         Returns list of CuratorDecision objects (for logging/debugging).
         """
+        if not candidates:
+            return []
+
         decisions = []
 
-        # Build O(1) lookup once for all candidates this turn
-        active_by_key: dict = {}
-        for mem in self.store.get_all_active():
-            active_by_key[(mem.key, mem.type)] = mem
+        # Live O(1) lookup maintained by the store; _execute() keeps it
+        # current as candidates are written.
+        active_by_key = self.store.active_by_key_view()
+
+        # memory_id -> live MemoryObject (or None if deleted) for everything
+        # written this turn; their precomputed scores are stale.
+        touched: dict = {}
 
-        for candidate in candidates:
-            decision = self._decide(candidate, turn, active_by_key)
-            decisions.append(decision)
-            self._execute(decision, turn)
+        # One wall-clock stamp for every UPDATE this turn.
+        now = time.time()
 
-            if decision.operation == CuratorOp.ADD:
-                active_by_key[(candidate.key, candidate.type)] = candidate
-            elif decision.operation == CuratorOp.UPDATE and decision.target_id:
-                # Update the value in cache so subsequent lookups are fresh
-                existing = active_by_key.get((candidate.key, candidate.type))
-                if existing:
-                    existing.value = candidate.value
+        # All of this turn's SQLite writes go out in a single commit.
+        with self.store.transaction():
+            neighbors = self._live_neighbors(candidates, turn, active_by_key)
+            for candidate, similar in zip(candidates, neighbors):
+                similar  = self._fresh_neighbors(candidate, similar, touched)
+                decision = self._decide(candidate, turn, active_by_key, similar)
+                decisions.append(decision)
+                self._execute(decision, turn, now)
+                self._track_writes(decision, touched)
 
         return decisions
 
     def run_decay(self, turn: int) -> list:
         """
         Trigger heat decay pass. Returns list of evicted memory_ids.
-        Called once per turn after processing.
+        Called once per turn after processing; only every DECAY_INTERVAL-th
+        turn actually runs the full pass.
         """
+        if turn % DECAY_INTERVAL:
+            return []
         return self.store.apply_decay(turn)
 
     # Decision Logic
 
+    def _live_neighbors(self, candidates: list, turn: int,
+                        active_by_key: dict) -> list:
+        """
+        One batched semantic search for every candidate against the store
+        as it was at the start of the turn. Each decision invalidates at
+        most one existing hit, so over-fetch by len(candidates). Hits stay
+        raw (unscored) so _fresh_neighbors() can pick by similarity.
+
+        Decay only runs every DECAY_INTERVAL turns, so a same-key match or
+        neighbor may be a memory a per-turn pass would already have evicted.
+        Those are evicted first (and the search redone without them) so they
+        never turn a fresh re-statement into a NOOP or UPDATE.
+        """
+        queries = [c.embed_text for c in candidates]
+        while True:
+            neighbors = self.store.semantic_neighbors_batch(
+                queries,
+                top_k=SEMANTIC_NEIGHBORS + len(candidates),
+                upto_turn=turn - 1,
+            )
+            seen = [m.memory_id for hits in neighbors for m, _, _ in hits]
+            for c in candidates:
+                match = active_by_key.get((c.key, c.type))
+                if match is not None:
+                    seen.append(match.memory_id)
+            if not self.store.evict_dead(seen, turn):
+                return neighbors
+
+    def _fresh_neighbors(self, candidate: MemoryObject, similar: list,
+                         touched: dict) -> list:
+        """
+        Patch a precomputed raw neighbor list with this turn's writes: drop
+        hits that were updated or deleted, then rescore the live written
+        memories. Like a fresh per-candidate search, the SEMANTIC_NEIGHBORS
+        most similar are kept by raw cosine before heat weighting and the
+        threshold are applied.
+        """
+        if touched:
+            similar = [n for n in similar if n[0].memory_id not in touched]
+            similar += self.store.semantic_pairs(
+                candidate.embed_text,
+                [m for m in touched.values() if m is not None],
+            )
+            similar.sort(key=lambda x: x[1], reverse=True)
+        return self.store.rank_neighbors(similar[:SEMANTIC_NEIGHBORS],
+                                         threshold=SIMILARITY_FOR_CONFLICT)
+
+    def _track_writes(self, decision: CuratorDecision, touched: dict):
+        """Record which memories _execute() just wrote or removed."""
+        op  = decision.operation
+        mem = decision.candidate
+
+        if op == CuratorOp.ADD:
+            touched[mem.memory_id] = mem
+        elif op == CuratorOp.UPDATE:
+            if decision.target_id:
+                touched[decision.target_id] = self.store.warm.get_by_id(decision.target_id)
+            else:
+                touched[mem.memory_id] = mem
+        elif op == CuratorOp.DELETE:
+            if decision.target_id:
+                touched[decision.target_id] = None
+            touched[mem.memory_id] = mem
+
     def _decide(self, candidate: MemoryObject, turn: int,
-                active_by_key: dict) -> CuratorDecision:
+                active_by_key: dict, similar: list) -> CuratorDecision:
         """
         Core logic: compare candidate against existing memories to decide operation.
-        Uses O(1) key lookup first, then semantic search for cross-key conflicts.
+        Uses O(1) key lookup first, then the candidate's semantic neighbors
+        (precomputed by process()) for cross-key conflicts.
         """
 
         # Check 1: Same key exact match (O(1) dict lookup)
@@ -106,17 +192,18 @@ class Curator:
                 )
 
         # Check 2: Semantic similarity for cross-key conflicts
-        similar = self.store.semantic_search(
-            query=candidate.embed_text,
-            top_k=3,
-            threshold=SIMILARITY_FOR_CONFLICT,  
-        )
+        # `similar` is already sorted by score, descending, so the first
+        # returning decision is the strongest. Candidate normalisation and
+        # word set are computed once; each neighbor's value is normalised once.
+        cand_norm  = self._normalize(candidate.value)
+        cand_words = frozenset(cand_norm.split())
 
         for existing_mem, score in similar:
+            old_norm = self._normalize(existing_mem.value)
 
             if score >= SIMILARITY_FOR_DUPLICATE:
                 # Very high similarity — check for duplicate first.
-                if self._values_are_same(candidate.value, existing_mem.value):
+                if cand_norm == old_norm:
                     return CuratorDecision(
                         operation=CuratorOp.NOOP,
                         candidate=candidate,
@@ -125,7 +212,7 @@ class Curator:
                     )
 
             if score >= SIMILARITY_FOR_CONFLICT:
-                if self._is_contradiction(candidate.value, existing_mem.value):
+                if self._contradicts(cand_norm, old_norm, cand_words):
                     return CuratorDecision(
                         operation=CuratorOp.DELETE,
                         candidate=candidate,
@@ -143,7 +230,8 @@ class Curator:
 
     # Execution
 
-    def _execute(self, decision: CuratorDecision, turn: int):
+    def _execute(self, decision: CuratorDecision, turn: int,
+                 now: Optional[float] = None):
         """Apply the decided operation to the memory store."""
         op  = decision.operation
         mem = decision.candidate
@@ -153,7 +241,7 @@ class Curator:
 
         elif op == CuratorOp.UPDATE:
             if decision.target_id:
-                self.store.update(decision.target_id, mem.value, turn)
+                self.store.update(decision.target_id, mem.value, turn, now=now)
             else:
                 self.store.add(mem)   # fallback: add if target missing
 
@@ -167,9 +255,13 @@ class Curator:
 
     # Helpers
 
+    @staticmethod
+    def _normalize(value: str) -> str:
+        return value.lower().strip()
+
     def _values_are_same(self, v1: str, v2: str) -> bool:
         """Normalise and compare two values."""
-        return v1.lower().strip() == v2.lower().strip()
+        return self._normalize(v1) == self._normalize(v2)
 
     def _is_contradiction(self, new_val: str, old_val: str) -> bool:
         """
@@ -180,29 +272,33 @@ class Curator:
         (100% different words), triggering a false contradiction and
         deleting a valid dietary memory.
         """
-        new_lower = new_val.lower().strip()
-        old_lower = old_val.lower().strip()
+        new_lower = self._normalize(new_val)
+        return self._contradicts(new_lower, self._normalize(old_val),
+                                 frozenset(new_lower.split()))
 
+    def _contradicts(self, new_lower: str, old_lower: str,
+                     new_words: frozenset) -> bool:
+        """
+        _is_contradiction() on already-normalised values. new_words is the
+        word set of new_lower, precomputed so one candidate compared against
+        several neighbors is split only once.
+        """
         # Guard: known synonym pairs are never contradictions
-        pair = {new_lower, old_lower}
-        if pair in NON_CONTRADICTION_PAIRS:
+        if frozenset((new_lower, old_lower)) in NON_CONTRADICTION_PAIRS:
             return False
 
         # Number change (age, times, phone numbers)
-        new_nums = set(re.findall(r'\d+', new_lower))
-        old_nums = set(re.findall(r'\d+', old_lower))
-        if new_nums and old_nums and new_nums != old_nums:
-            return True
+        new_nums = _NUM_RE.findall(new_lower)
+        if new_nums:
+            old_nums = _NUM_RE.findall(old_lower)
+            if old_nums and set(new_nums) != set(old_nums):
+                return True
 
         # Word overlap — less than 20% shared words = likely contradiction
-        new_words = set(new_lower.split())
         old_words = set(old_lower.split())
         overlap   = len(new_words & old_words)
-        total     = len(new_words | old_words)
-        if total > 0 and (overlap / total) < 0.2:
-            return True
-
-        return False
+        total     = len(new_words) + len(old_words) - overlap   # |union|
+        return total > 0 and overlap * 5 < total
 
     # LLM-Based Decision (bonus path)
 
@@ -240,9 +336,9 @@ JSON:"""
     def parse_llm_decision(self, response: str, candidate: MemoryObject) -> CuratorDecision:
         """Parse LLM's JSON response into a CuratorDecision."""
         try:
-            clean = response.strip()
-            if clean.startswith("```"):
-                clean = re.sub(r"```(?:json)?", "", clean).strip().strip("```")
+            # FIX: the old .strip("```") stripped any backtick *characters*,
+            # not the fence substring.
+            clean = _FENCE_RE.sub("", response.strip())
             data  = json.loads(clean)
             op    = CuratorOp(data.get("operation", "NOOP"))
             return CuratorDecision(
@@ -9,13 +9,16 @@ Usage:
     print(result.memories_used)   # which memories were injected
 """
 
-import time
 import threading
+import time
+import traceback
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from typing import Optional, Callable
 
-from .models       import MemoryObject, MemoryType, CuratorOp
-from .memory_store import MemoryStore
+from .models       import MemoryObject, MemoryType, CuratorOp, ExtractionResult
+from .memory_store import MemoryStore, WarmTier
 from .sentinel     import Sentinel
 from .oracle       import Oracle
 from .curator      import Curator
@@ -35,6 +38,9 @@ class TurnResult:
     latency_ms:         float = 0.0
     sentinel_extracted: int   = 0
     curator_ops:        dict  = field(default_factory=dict)  # op counts per CuratorOp
+    # Resolves (to this TurnResult) once the background fields above —
+    # memories_added, evicted, sentinel_extracted, curator_ops — are filled.
+    memory_ops:         Optional[Future] = None
 
 
 # Engine
@@ -51,16 +57,26 @@ class MnemosyneEngine:
 
     Threading model:
       - Oracle.retrieve() and LLM call run on the calling thread.
-      - Sentinel.extract() and Curator.process() run in a daemon thread
-        started after the LLM response is ready.
-      - thread.join(timeout) is used so TurnResult fields are populated
-        before chat() returns. This is intentionally blocking for demo
-        visibility. In a streaming production system, remove join() and
-        read async results via engine.last_async_result.
-      - self._lock guards Sentinel+Curator so concurrent chat() calls
-        from different threads never write to the store simultaneously.
-        For true concurrent multi-user use, give each session its own
-        MnemosyneEngine instance instead.
+      - Sentinel.extract() starts on its own single-worker executor at the
+        top of the turn, so its LLM round trip overlaps Oracle + the
+        response call (extraction only affects future turns).
+      - Curator.process() runs on a single-worker ThreadPoolExecutor,
+        submitted after the LLM response is ready; it picks up the
+        Sentinel result there. No thread is created per turn.
+      - chat() does NOT wait for that work. It returns as soon as the
+        response is ready; TurnResult.memory_ops is a Future that
+        resolves once the background fields are populated.
+      - The next chat() waits (with timeout) for the previous turn's
+        Future before Oracle.retrieve(), so memories extracted on turn N
+        are visible on turn N+1. flush() does the same on demand.
+      - The single worker runs jobs in FIFO order, so concurrent chat()
+        calls from different threads never write to the store
+        simultaneously. For true concurrent multi-user use, give each
+        session its own MnemosyneEngine instance instead.
+      - Every store access (worker writes, Oracle retrieval, the public
+        convenience methods) holds self._store_lock, so calling e.g.
+        inject_memory() right after chat() can't interleave with the
+        worker's writes.
     """
 
     BASE_SYSTEM_PROMPT = """You are a helpful, intelligent assistant.
@@ -79,6 +95,8 @@ Use that context naturally — never mention that you have a memory system."""
             db_path: SQLite path. \":memory:\" for ephemeral, file path for persistence.
                      ChromaDB path is derived automatically from this value.
             llm_fn:  Optional callable(system_prompt, user_message, history) → str.
+                     history is a list of {"role", "content"} dicts
+                     (a snapshot copy, at most HISTORY_WINDOW items).
                      If None, engine works in extraction/retrieval-only mode.
             confidence_threshold: Sentinel gate — only memories above this are stored.
             verbose: Print per-turn debug info to stdout.
@@ -94,12 +112,18 @@ Use that context naturally — never mention that you have a memory system."""
 
         self.turn_number = 0
 
-        self.history: list = []
+        # deque(maxlen) drops the oldest messages on append — no re-slicing.
+        self.history: deque = deque(maxlen=HISTORY_WINDOW)
 
-        self._lock = threading.Lock()
+        # Serialises store access between the calling thread and the worker.
+        self._store_lock = threading.RLock()
 
-        # Populated by the async thread; readable after join() returns.
-        self._last_async: dict = {}
+        # Background worker for Sentinel + Curator, and the previous
+        # turn's still-running job (if any). Sentinel's LLM call gets its
+        # own worker so it can start before the response is ready.
+        self._executor          = ThreadPoolExecutor(max_workers=1)
+        self._sentinel_executor = ThreadPoolExecutor(max_workers=1)
+        self._pending: Optional[Future] = None
 
     # Public API
 
@@ -109,21 +133,36 @@ Use that context naturally — never mention that you have a memory system."""
         Returns a TurnResult with response + full audit trail.
 
         Execution order:
+          0. Previous turn's background work is awaited (timeout 5s),
+             then Sentinel extraction is dispatched in the background
           1. Oracle retrieves relevant memories (SYNC, ~20ms)
           2. LLM is called with memory-injected prompt (SYNC, ~200ms)
           3. History is updated
-          4. Sentinel + Curator run in background thread
-          5. join(timeout) waits for background thread so TurnResult is complete
-          6. Latency is measured and returned
+          4. Curator (consuming the Sentinel result) is submitted to the
+             background worker
+          5. Latency is measured and returned; the async TurnResult fields
+             are filled later (wait on result.memory_ops to read them)
         """
-        t_start = time.time()
+        t_start = time.perf_counter_ns()   # monotonic, immune to clock jumps
+
+        # Oracle must see the memories the previous turn extracted.
+        if not self.flush(timeout=5.0) and self.verbose:
+            print(f"[Turn {self.turn_number}] WARNING: async memory ops "
+                  f"timed out after 5s")
+
         self.turn_number += 1
         turn = self.turn_number
 
         result = TurnResult(turn_number=turn, user_message=user_message)
 
+        # BACKGROUND: Sentinel's LLM call overlaps Oracle + response.
+        extraction = self._sentinel_executor.submit(
+            self.sentinel.extract, user_message, turn
+        )
+
         # SYNC: Oracle retrieves relevant memories BEFORE inference
-        retrieval = self.oracle.retrieve(query=user_message, turn_number=turn)
+        with self._store_lock:
+            retrieval = self.oracle.retrieve(query=user_message, turn_number=turn)
         result.memories_used = retrieval.memories
         result.prompt_block  = retrieval.prompt_block
 
@@ -139,80 +178,102 @@ Use that context naturally — never mention that you have a memory system."""
         response = self._call_llm(system_prompt, user_message)
         result.response = response
 
-        # Update rolling history window.
-        # FIX: slice to HISTORY_WINDOW AFTER appending so list never grows
-        # beyond the cap. Previously the full history accumulated forever.
+        # Update rolling history window (bounded deque keeps last 10 turns).
+        # HISTORY_WINDOW is even, so the window always holds whole
+        # user/assistant pairs.
         self.history.append({"role": "user",      "content": user_message})
         self.history.append({"role": "assistant",  "content": response})
-        self.history = self.history[-HISTORY_WINDOW:]   # keep last 10 turns
-
-        # BACKGROUND: Sentinel extracts + Curator updates
-        # Capture turn in closure to avoid closing over a mutable variable.
-        captured_turn    = turn
-        captured_message = user_message
-
-        async_output: dict = {}
-
-        def async_memory_ops():
-            with self._lock:
-                extraction = self.sentinel.extract(captured_message, captured_turn)
-
-                if self.verbose and extraction.filtered_in:
-                    print(f"[Turn {captured_turn}] Sentinel extracted: "
-                          + ", ".join(f"{m.key}={m.value}"
-                                      for m in extraction.filtered_in))
-
-                decisions = self.curator.process(extraction.filtered_in, captured_turn)
-
-                op_counts = {op.value: 0 for op in CuratorOp}
-                added = []
-                for d in decisions:
-                    op_counts[d.operation.value] += 1
-                    if d.operation in (CuratorOp.ADD, CuratorOp.UPDATE):
-                        added.append(d.candidate)
-
-                evicted = self.curator.run_decay(captured_turn)
-
-                if self.verbose and evicted:
-                    print(f"[Turn {captured_turn}] Curator evicted: {evicted}")
-
-                # Write to local dict — no shared mutable state with main thread
-                async_output["sentinel_extracted"] = len(extraction.filtered_in)
-                async_output["memories_added"]     = added
-                async_output["curator_ops"]        = op_counts
-                async_output["evicted"]            = evicted
-
-        thread = threading.Thread(target=async_memory_ops, daemon=True)
-        thread.start()
-
-        # Block until background work completes (or times out).
-        # Intentionally blocking here so TurnResult is fully populated
-        # before returning — useful for demos, tests, and sequential chat.
-        # In a streaming production system, remove join() and read
-        # self._last_async after the fact.
-        thread.join(timeout=5.0)
-
-        # FIX: only copy async results into TurnResult if the thread actually
-        # finished. If it timed out, fields stay at their safe defaults.
-        if not thread.is_alive():
-            result.sentinel_extracted = async_output.get("sentinel_extracted", 0)
-            result.memories_added     = async_output.get("memories_added", [])
-            result.curator_ops        = async_output.get("curator_ops", {})
-            result.evicted            = async_output.get("evicted", [])
-        elif self.verbose:
-            print(f"[Turn {turn}] WARNING: async thread timed out after 5s")
-
-        result.latency_ms = round((time.time() - t_start) * 1000, 1)
+
+        # BACKGROUND: Curator updates on the worker once Sentinel is done.
+        # Turn and message are passed by value with the job.
+        self._pending = self._executor.submit(
+            self._run_memory_ops, result, extraction, turn
+        )
+        result.memory_ops = self._pending
+
+        result.latency_ms = (time.perf_counter_ns() - t_start) / 1_000_000
+        return result
+
+    # Background Worker
+
+    def _run_memory_ops(self, result: TurnResult, extraction: Future,
+                        turn: int) -> TurnResult:
+        """Worker job: run memory ops and fill result's async fields."""
+        try:
+            out = self._memory_ops(extraction.result(), turn)
+        except Exception:
+            # Keep the worker alive; the turn just reports no async results.
+            traceback.print_exc()
+            return result
+        result.sentinel_extracted = out["sentinel_extracted"]
+        result.memories_added     = out["memories_added"]
+        result.curator_ops        = out["curator_ops"]
+        result.evicted            = out["evicted"]
         return result
 
+    def _memory_ops(self, extraction: ExtractionResult, turn: int) -> dict:
+        """Curator processing of a Sentinel extraction + decay for one turn."""
+        if self.verbose and extraction.filtered_in:
+            print(f"[Turn {turn}] Sentinel extracted: "
+                  + ", ".join(f"{m.key}={m.value}"
+                              for m in extraction.filtered_in))
+
+        # Curator writes and the decay pass share one SQLite commit per turn.
+        with self._store_lock, self.store.transaction():
+            # Chit-chat turns usually extract nothing: skip Curator entirely.
+            if extraction.filtered_in:
+                decisions = self.curator.process(extraction.filtered_in, turn)
+            else:
+                decisions = []
+            evicted = self.curator.run_decay(turn)
+
+        op_counts = {op.value: 0 for op in CuratorOp}
+        added = []
+        for d in decisions:
+            op_counts[d.operation.value] += 1
+            if d.operation in (CuratorOp.ADD, CuratorOp.UPDATE):
+                added.append(d.candidate)
+
+        if self.verbose and evicted:
+            print(f"[Turn {turn}] Curator evicted: {evicted}")
+
+        return {
+            "sentinel_extracted": len(extraction.filtered_in),
+            "memories_added":     added,
+            "curator_ops":        op_counts,
+            "evicted":            evicted,
+        }
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for the last submitted turn's background work.
+        Returns False if it is still running after timeout.
+        """
+        if self._pending is None:
+            return True
+        done, _ = wait([self._pending], timeout=timeout)
+        if done:
+            self._pending = None
+            return True
+        return False
+
+    def close(self):
+        """Stop the background workers after they drain already-queued jobs."""
+        self._sentinel_executor.shutdown(wait=True)
+        self._executor.shutdown(wait=True)
+        self._pending = None
+        self.store.close()
+
     # Convenience Methods
 
     def get_memory_snapshot(self) -> list:
         """Return all current memories sorted by heat (highest first)."""
-        return self.store.get_snapshot()
+        with self._store_lock:
+            return self.store.get_snapshot()
 
     def get_memories_by_type(self, memory_type: MemoryType) -> list:
-        return self.store.get_by_type(memory_type)
+        with self._store_lock:
+            return self.store.get_by_type(memory_type)
 
     def inject_memory(self, key: str, value: str,
                       mem_type: MemoryType = MemoryType.FACT,
@@ -224,7 +285,8 @@ Use that context naturally — never mention that you have a memory system."""
             last_recalled_turn=self.turn_number,
             heat=confidence, confidence=confidence,
         )
-        self.store.add(mem)
+        with self._store_lock:
+            self.store.add(mem)
         return mem
 
     def reset(self):
@@ -238,7 +300,12 @@ Use that context naturally — never mention that you have a memory system."""
 
         FIX 2: Re-initialises all four agents (including Sentinel) for
         consistency, even though Sentinel carries no state.
+
+        Also drops the process-wide query embedding cache, and drains the
+        background worker so no queued job writes into the old store.
         """
+        self.close()
+        WarmTier.clear_embedding_cache()
         self.store    = MemoryStore(db_path=self.db_path)
         self.sentinel = Sentinel(
             confidence_threshold=self.sentinel.threshold
@@ -246,7 +313,9 @@ Use that context naturally — never mention that you have a memory system."""
         self.oracle   = Oracle(store=self.store)
         self.curator  = Curator(store=self.store)
         self.turn_number = 0
-        self.history  = []
+        self.history.clear()
+        self._executor          = ThreadPoolExecutor(max_workers=1)
+        self._sentinel_executor = ThreadPoolExecutor(max_workers=1)
 
     # LLM Call
 
@@ -258,7 +327,9 @@ Use that context naturally — never mention that you have a memory system."""
             return self.llm_fn(
                 system_prompt=system_prompt,
                 user_message=user_message,
-                history=self.history,   # already windowed to last 10 turns
+                # Snapshot list: callers may slice it, and the engine keeps
+                # mutating its own deque.
+                history=list(self.history),   # already windowed to last 10 turns
             )
         except Exception as e:
             return f"[LLM error: {e}]"
@@ -267,7 +338,7 @@ Use that context naturally — never mention that you have a memory system."""
 
     def stats(self) -> dict:
         """Summary stats for the current session."""
-        all_mems = self.store.get_snapshot()
+        all_mems = self.get_memory_snapshot()
         type_counts = {}
         for m in all_mems:
             t = m.type.value
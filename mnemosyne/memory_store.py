@@ -3,14 +3,21 @@ MNEMOSYNE — Memory Store (Layer 2) [UPGRADED — ChromaDB]
 3-Tier hybrid storage: Hot (ring buffer) → Warm (ChromaDB) → Cold (SQLite)
 
 Hot  Tier: Python deque, last 40 extracted memories. O(1) access, no I/O.
-Warm Tier: ChromaDB with cosine similarity embeddings. Semantic search.
+Warm Tier: ChromaDB persistence + NumPy cosine index. Semantic search.
 Cold Tier: SQLite for structured persistence. Survives restarts.
 """
 
+import queue
 import sqlite3
 import time
+import threading
+import traceback
+import weakref
+from contextlib import contextmanager
 import chromadb
-from collections import deque
+import numpy as np
+from chromadb.utils import embedding_functions
+from collections import OrderedDict, deque
 from typing import Optional
 from .models import MemoryObject, MemoryType, MemoryStatus
 
@@ -26,23 +33,96 @@ class HotTier:
 
     def __init__(self):
         self._buffer: deque = deque(maxlen=self.HOT_SIZE)
+        self._by_id: dict = {}   # memory_id -> newest buffered MemoryObject
 
     def add(self, memory: MemoryObject):
+        if len(self._buffer) == self.HOT_SIZE:
+            # appendleft will drop the oldest entry; unindex it unless a
+            # newer object with the same id has taken its slot.
+            oldest = self._buffer[-1]
+            if self._by_id.get(oldest.memory_id) is oldest:
+                del self._by_id[oldest.memory_id]
         self._buffer.appendleft(memory)
+        self._by_id[memory.memory_id] = memory
 
     def get_all(self) -> list:
         return list(self._buffer)
 
     def find_by_id(self, memory_id: str) -> Optional[MemoryObject]:
-        for m in self._buffer:
-            if m.memory_id == memory_id:
-                return m
-        return None
+        return self._by_id.get(memory_id)
 
     def __len__(self):
         return len(self._buffer)
 
 
+# Embedding Cache
+
+class _EmbeddingCache:
+    """
+    Process-wide LRU of normalised text -> L2-normalised float32 vector.
+    Unlike functools.lru_cache it looks up many texts at once and hands all
+    misses to the encoder in one call, so batches stay batched.
+    Cached arrays are read-only because they are shared between callers.
+    hits/misses count lookups since the last cache_clear(), for sizing.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.hits    = 0
+        self.misses  = 0
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_many(self, texts: list, encode) -> list:
+        out     = [None] * len(texts)
+        missing: dict = {}   # text -> positions in out
+        with self._lock:
+            for i, t in enumerate(texts):
+                vec = self._data.get(t)
+                if vec is None:
+                    missing.setdefault(t, []).append(i)
+                else:
+                    self._data.move_to_end(t)
+                    out[i] = vec
+            self.hits   += len(texts) - sum(map(len, missing.values()))
+            self.misses += len(missing)
+
+        if missing:
+            new_texts = list(missing)
+            vecs = encode(new_texts)
+            with self._lock:
+                for t, vec in zip(new_texts, vecs):
+                    for i in missing[t]:
+                        out[i] = vec
+                    self._data[t] = vec
+                while len(self._data) > self.maxsize:
+                    self._data.popitem(last=False)
+        return out
+
+    def cache_clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+
+# Null Collection (ephemeral mode)
+
+class _NullCollection:
+    """
+    Stands in for a Chroma collection when nothing should be persisted.
+    Writes are dropped and get() finds nothing; the in-process vector index
+    is the whole warm tier.
+    """
+
+    def upsert(self, **kwargs):
+        pass
+
+    update = delete = upsert
+
+    def get(self, ids: list, include: list) -> dict:
+        return {"ids": [], "embeddings": [], "documents": []}
+
+
 # Warm Tier: ChromaDB Vector Store
 
 class WarmTier:
@@ -55,86 +135,370 @@ class WarmTier:
 
     FIX WARN-1: Explicitly sets hnsw:space=cosine so distances are always
     in the range [0, 2], making 1/(1+d) scores consistent and predictable.
+
+    PERF: Scoring runs against an in-process SoA matrix of L2-normalised
+    embeddings (one row per memory), so a search is a single
+    matrix-vector product instead of a Chroma round trip. Chroma is kept
+    as the persistent (float32) copy of the vectors.
+
+    PERF: Index rows are int8 with a per-row float32 scale (4x less memory
+    and bandwidth than float32). Dot products accumulate in int32 and are
+    rescaled to cosine similarity afterwards.
+
+    PERF: Chroma writes run on a background writer thread in submission
+    order; the in-process index and cache are updated synchronously, so
+    reads never wait on Chroma. flush() waits for queued writes.
+
+    PERF: heat and last_recalled_turn are mirrored into row-aligned arrays
+    (synced on every upsert) so decay and relevance ranking are NumPy ops
+    instead of per-object attribute walks.
+
+    persistence_path=None is ephemeral mode: no Chroma client (nothing on
+    disk, no writer thread); search is the same exact in-process kNN.
     """
 
-    def __init__(self, persistence_path: str = "mnemosyne_chroma",
+    INITIAL_CAPACITY  = 64    # rows pre-allocated in the vector index
+    WRITE_BATCH       = 250   # max records per Chroma upsert/delete call
+    EMBED_BATCH       = 64    # max texts per embedding model call
+    SGEMM_MIN_QUERIES = 4     # queries per call from which _cosine uses SGEMM
+    DEQUANT_BLOCK     = 1024  # index rows widened to float32 per SGEMM block
+
+    # Same MiniLM model Chroma uses by default, run here so each text is
+    # embedded once and the vector handed to Chroma (Chroma never embeds).
+    # Model and cache are shared by every WarmTier.
+    # 2048 entries x 384 dims x 4B ~= 3 MB.
+    _EMBED_FN    = embedding_functions.DefaultEmbeddingFunction()
+    _EMBED_CACHE = _EmbeddingCache(maxsize=2048)
+
+    def __init__(self, persistence_path: Optional[str] = "mnemosyne_chroma",
                  collection_name: str = "memories"):
         # 1. ChromaDB persistent client (saves to disk at persistence_path)
 
-        self.client = chromadb.PersistentClient(path=persistence_path)
+        if persistence_path is None:
+            self.client     = None
+            self.collection = _NullCollection()
+        else:
+            self.client = chromadb.PersistentClient(path=persistence_path)
 
-        # 2. Get or create collection.
+            # 2. Get or create collection.
 
-        self.collection = self.client.get_or_create_collection(
-            name=collection_name,
-            metadata={"hnsw:space": "cosine"},
-        )
+            self.collection = self.client.get_or_create_collection(
+                name=collection_name,
+                metadata={"hnsw:space": "cosine"},
+            )
 
         # 3. In-memory cache for fast full-object access.
         #    Chroma stores text + metadata but not our full MemoryObject.
         self._memories: dict = {}   # memory_id -> MemoryObject
+        # MemoryType -> {memory_id: MemoryObject}, in _memories order, plus
+        # each id's bucket so a type change can leave the old one.
+        self._by_type: dict = {}
+        self._type_of: dict = {}    # memory_id -> MemoryType
+
+        # 4. Hot vector index (int8 rows + dequantisation scale per row).
+        self._mat: Optional[np.ndarray]    = None  # int8 [capacity, D], lazy
+        self._scales: Optional[np.ndarray] = None  # float32 [capacity]
+        self._ids: list  = []                   # row -> memory_id
+        self._rows: dict = {}                   # memory_id -> row
+        self._heat = np.zeros(0, dtype=np.float64)  # row -> heat
+        self._lrt  = np.zeros(0, dtype=np.int64)    # row -> last_recalled_turn
+        self._texts: dict = {}                  # memory_id -> text embedded in its row
+
+        # 5. Background Chroma writer. Jobs carry fully built arguments, so
+        #    later in-place mutation of a MemoryObject can't leak into them.
+        #    Neither the thread nor the finalizer references self, so an
+        #    unclosed WarmTier can still be collected; the finalizer also
+        #    runs at interpreter exit (daemon thread: drain before exit).
+        self._write_q: queue.Queue = queue.Queue()
+        self._writer = threading.Thread(target=self._write_loop,
+                                        args=(self._write_q,),
+                                        name="warm-writer", daemon=True)
+        if self.client is not None:   # ephemeral: no-op writes run inline
+            self._writer.start()
+        self._finalizer = weakref.finalize(self, self._stop_writer,
+                                           self._write_q, self._writer)
+
+    # Background Writes
+
+    @staticmethod
+    def _write_loop(write_q: queue.Queue):
+        while True:
+            job = write_q.get()
+            try:
+                if job is None:
+                    return
+                fn, kwargs = job
+                fn(**kwargs)
+            except Exception:
+                traceback.print_exc()
+            finally:
+                write_q.task_done()
+
+    @staticmethod
+    def _stop_writer(write_q: queue.Queue, writer: threading.Thread):
+        if writer.is_alive():
+            write_q.put(None)
+            writer.join()
+
+    def _submit(self, fn, **kwargs):
+        if self._writer.is_alive():
+            self._write_q.put((fn, kwargs))
+        else:
+            fn(**kwargs)   # after close(): write through
 
-    def upsert(self, memory: MemoryObject):
-        """Add or update a memory in both ChromaDB and the local cache."""
-        self._memories[memory.memory_id] = memory
-        self.collection.upsert(
-            ids=[memory.memory_id],
-            documents=[memory.embed_text],
-            metadatas=[{
-                "type":   memory.type.value,
-                "heat":   memory.heat,
-                "status": memory.status.value,
-            }],
-        )
-
-    def remove(self, memory_id: str):
-        """Delete from both local cache and ChromaDB."""
-        self._memories.pop(memory_id, None)
+    @staticmethod
+    def _delete(collection, ids: list):
         try:
-            self.collection.delete(ids=[memory_id])
+            collection.delete(ids=ids)
         except (ValueError, Exception):
             pass
 
-    def search(self, query: str, top_k: int = 8,
-               threshold: float = 0.15) -> list:
+    def flush(self):
+        """Block until every queued Chroma write has been applied."""
+        self._write_q.join()
+
+    def close(self):
+        """Drain queued writes and stop the writer thread. Idempotent."""
+        self._finalizer()
+
+    @classmethod
+    def _encode(cls, texts: list) -> np.ndarray:
+        """Run the model over texts in EMBED_BATCH chunks. Unit-norm, read-only."""
+        vecs = np.concatenate([
+            np.asarray(cls._EMBED_FN(texts[i:i + cls.EMBED_BATCH]), dtype=np.float32)
+            for i in range(0, len(texts), cls.EMBED_BATCH)
+        ])
+        norms = np.linalg.norm(vecs, axis=1, keepdims=True)
+        norms[norms == 0.0] = 1.0
+        vecs = vecs / norms
+        vecs.flags.writeable = False
+        return vecs
+
+    @classmethod
+    def clear_embedding_cache(cls):
+        cls._EMBED_CACHE.cache_clear()
+
+    @classmethod
+    def embedding_cache_info(cls) -> dict:
+        cache = cls._EMBED_CACHE
+        return {"hits": cache.hits, "misses": cache.misses,
+                "size": len(cache._data), "maxsize": cache.maxsize}
+
+    @staticmethod
+    def _normalize_text(text: str) -> str:
+        # MiniLM's tokenizer is uncased and splits on whitespace, so lowercasing
+        # and collapsing whitespace do not change the vector; they only widen
+        # cache hits (retried/re-spaced queries map to one entry).
+        return " ".join(text.lower().split())
+
+    def _vectorize(self, texts: list) -> np.ndarray:
+        """Embed texts into an L2-normalised float32 matrix [len(texts), D]."""
+        norm = [self._normalize_text(t) for t in texts]
+        return np.stack(self._EMBED_CACHE.get_many(norm, self._encode))
+
+    def embed_query(self, query: str) -> np.ndarray:
         """
-        Semantic search using ChromaDB vector embeddings.
-        Returns list of (MemoryObject, score) sorted descending.
-
-        FIX: threshold default changed from 0.0 to 0.15 to match
-        MemoryStore.semantic_search and avoid returning noise.
+        L2-normalised float32 vector [D] for query, served from the shared
+        embedding LRU when the normalised text has been seen before.
+        """
+        return self._vectorize([query])[0]
 
-        FIX: n_results capped at len(_memories) to prevent ChromaDB
-        ValueError when top_k > number of documents in collection.
+    @staticmethod
+    def _quantize(vecs: np.ndarray) -> tuple:
         """
-        if not self._memories:
-            return []
+        Symmetric per-row int8 quantisation of a float32 matrix [K, D].
+        Returns (int8 [K, D], float32 [K]) where row ≈ int8_row * scale.
+        """
+        peak = np.abs(vecs).max(axis=1)
+        peak[peak == 0.0] = 1.0
+        q = np.round(vecs * (127.0 / peak)[:, None]).astype(np.int8)
+        return q, (peak / 127.0).astype(np.float32)
+
+    def _set_row(self, memory_id: str, vec: np.ndarray):
+        """Write vec into memory_id's row, appending (and growing) if new."""
+        row = self._rows.get(memory_id)
+        if row is None:
+            if self._mat is None:
+                self._mat    = np.zeros((self.INITIAL_CAPACITY, vec.shape[0]),
+                                        dtype=np.int8)
+                self._scales = np.zeros(self.INITIAL_CAPACITY, dtype=np.float32)
+                self._heat   = np.zeros(self.INITIAL_CAPACITY, dtype=np.float64)
+                self._lrt    = np.zeros(self.INITIAL_CAPACITY, dtype=np.int64)
+            elif len(self._ids) == self._mat.shape[0]:
+                n = len(self._ids)
+                self._mat    = self._grow(self._mat, 2 * n)
+                self._scales = self._grow(self._scales, 2 * n)
+                self._heat   = self._grow(self._heat, 2 * n)
+                self._lrt    = self._grow(self._lrt, 2 * n)
+            row = len(self._ids)
+            self._ids.append(memory_id)
+            self._rows[memory_id] = row
+        q, scale = self._quantize(vec[None, :])
+        self._mat[row]    = q[0]
+        self._scales[row] = scale[0]
+
+    @staticmethod
+    def _grow(arr: np.ndarray, capacity: int) -> np.ndarray:
+        grown = np.zeros((capacity,) + arr.shape[1:], dtype=arr.dtype)
+        grown[:arr.shape[0]] = arr
+        return grown
+
+    def _drop_row(self, memory_id: str):
+        """Swap-remove memory_id's row with the tail row. O(D)."""
+        row = self._rows.pop(memory_id, None)
+        if row is None:
+            return
+        last = len(self._ids) - 1
+        if row != last:
+            moved = self._ids[last]
+            self._mat[row]    = self._mat[last]
+            self._scales[row] = self._scales[last]
+            self._heat[row]   = self._heat[last]
+            self._lrt[row]    = self._lrt[last]
+            self._ids[row]    = moved
+            self._rows[moved] = row
+        self._ids.pop()
+
+    @staticmethod
+    def _metadata(memory: MemoryObject) -> dict:
+        return {
+            "type":   memory.type.value,
+            "heat":   memory.heat,
+            "status": memory.status.value,
+        }
+
+    def _index_type(self, memory: MemoryObject):
+        old = self._type_of.get(memory.memory_id)
+        if old is not None and old != memory.type:
+            self._by_type[old].pop(memory.memory_id, None)
+        self._type_of[memory.memory_id] = memory.type
+        self._by_type.setdefault(memory.type, {})[memory.memory_id] = memory
+
+    def _unindex_type(self, memory_id: str):
+        old = self._type_of.pop(memory_id, None)
+        if old is not None:
+            self._by_type[old].pop(memory_id, None)
 
-        # ChromaDB raises ValueError if n_results > collection size
-        k = min(top_k, len(self._memories))
+    def upsert(self, memory: MemoryObject):
+        """Add or update a memory in ChromaDB, the vector index and the local cache."""
+        self.upsert_many([memory])
 
-        results = self.collection.query(
-            query_texts=[query],
-            n_results=k,
-        )
+    def upsert_many(self, memories: list):
+        """
+        upsert() for many memories: one pass builds the parallel
+        ids/embeddings/documents/metadatas lists, then one Chroma call per
+        WRITE_BATCH records.
 
-        hits = []
-        ids       = results["ids"][0]
-        distances = results["distances"][0]
+        PERF: only memories whose embed_text changed are (re-)embedded and
+        upserted with vectors; metadata-only changes (heat/status) go out
+        as a Chroma update with no documents, so nothing is re-embedded.
+        """
+        if not memories:
+            return
+        fresh, meta_only = [], []
+        for memory in memories:
+            self._memories[memory.memory_id] = memory
+            self._index_type(memory)
+            if self._texts.get(memory.memory_id) == memory.embed_text:
+                meta_only.append(memory)
+            else:
+                fresh.append(memory)
+
+        if fresh:
+            vecs = self._vectorize([m.embed_text for m in fresh])
+            for memory, vec in zip(fresh, vecs):
+                self._set_row(memory.memory_id, vec)
+                self._texts[memory.memory_id] = memory.embed_text
+
+            for i in range(0, len(fresh), self.WRITE_BATCH):
+                chunk = fresh[i:i + self.WRITE_BATCH]
+                self._submit(
+                    self.collection.upsert,
+                    ids=[m.memory_id for m in chunk],
+                    embeddings=vecs[i:i + self.WRITE_BATCH].tolist(),
+                    documents=[m.embed_text for m in chunk],
+                    metadatas=[self._metadata(m) for m in chunk],
+                )
+
+        for memory in memories:
+            row = self._rows[memory.memory_id]
+            self._heat[row] = memory.heat
+            self._lrt[row]  = memory.last_recalled_turn
+
+        for i in range(0, len(meta_only), self.WRITE_BATCH):
+            chunk = meta_only[i:i + self.WRITE_BATCH]
+            self._submit(
+                self.collection.update,
+                ids=[m.memory_id for m in chunk],
+                metadatas=[self._metadata(m) for m in chunk],
+            )
+
+    def load(self, memories: list):
+        """
+        Startup sync of persisted memories. Vectors Chroma already holds for
+        an unchanged embed_text seed the index directly (fetched with
+        include=["embeddings", "documents"] only -- no metadata payload), so
+        a restart embeds just the memories Chroma is missing or stale on.
+        """
+        if not memories:
+            return
+        stored: dict = {}   # memory_id -> (document, embedding)
+        for i in range(0, len(memories), self.WRITE_BATCH):
+            got = self.collection.get(
+                ids=[m.memory_id for m in memories[i:i + self.WRITE_BATCH]],
+                include=["embeddings", "documents"],
+            )
+            for mid, emb, doc in zip(got["ids"], got["embeddings"], got["documents"]):
+                stored[mid] = (doc, emb)
 
-        for i, mem_id in enumerate(ids):
-            mem = self._memories.get(mem_id)
-            if mem is None:
+        for memory in memories:
+            hit = stored.get(memory.memory_id)
+            if hit is None or hit[0] != memory.embed_text:
                 continue
+            vec  = np.asarray(hit[1], dtype=np.float32)
+            norm = np.linalg.norm(vec)
+            if norm == 0.0:
+                continue
+            self._set_row(memory.memory_id, vec / norm)
+            self._texts[memory.memory_id] = memory.embed_text
+
+        # Seeded rows take the metadata-only path; the rest are embedded.
+        self.upsert_many(memories)
 
+    def remove(self, memory_id: str):
+        """Delete from the local cache, the vector index and ChromaDB."""
+        self.remove_many([memory_id])
+
+    def remove_many(self, memory_ids: list):
+        """remove() for many ids, one Chroma delete per WRITE_BATCH ids."""
+        if not memory_ids:
+            return
+        for memory_id in memory_ids:
+            self._memories.pop(memory_id, None)
+            self._unindex_type(memory_id)
+            self._texts.pop(memory_id, None)
+            self._drop_row(memory_id)
+        for i in range(0, len(memory_ids), self.WRITE_BATCH):
+            self._submit(self._delete, collection=self.collection,
+                         ids=memory_ids[i:i + self.WRITE_BATCH])
+
+    @staticmethod
+    def _to_hits(triples, threshold: float) -> list:
+        """
+        Turn (MemoryObject, cosine similarity, heat) triples into thresholded
+        (MemoryObject, score) hits sorted descending.
+        """
+        hits = []
+        for mem, sim, heat in triples:
             # Convert cosine distance (0-2) to similarity score (0.33-1.0).
             # distance=0.0 -> score=1.0 (perfect match)
             # distance=1.0 -> score=0.5
             # distance=2.0 -> score=0.33 (opposite)
-            raw_score = 1.0 / (1.0 + distances[i])
+            distance  = 1.0 - float(sim)
+            raw_score = 1.0 / (1.0 + distance)
 
             # Weight by heat: hotter memories rank higher when scores are close
-            adjusted_score = raw_score * (0.7 + 0.3 * mem.heat)
+            adjusted_score = raw_score * (0.7 + 0.3 * heat)
 
             if adjusted_score >= threshold:
                 hits.append((mem, adjusted_score))
@@ -142,6 +506,146 @@ class WarmTier:
         hits.sort(key=lambda x: x[1], reverse=True)
         return hits
 
+    def _cosine(self, queries: np.ndarray, rows_i8=None, rows_scale=None,
+                n: Optional[int] = None) -> np.ndarray:
+        """
+        Cosine similarity of query vectors [K, D] against the first n index
+        rows (or against rows_i8/rows_scale if given). int8 x int8 products
+        accumulate in int32 (int16 would overflow at D=384); result [K, N].
+
+        PERF: NumPy has no integer BLAS, so the int32 einsum only wins for a
+        few queries. From SGEMM_MIN_QUERIES up, rows are widened to float32
+        a block at a time and multiplied with SGEMM instead. Same values:
+        |dot| <= 384 * 127 * 127 < 2**24, so float32 sums are exact.
+        (N=20k, D=384, K=8: einsum ~44 ms, blocked SGEMM ~11 ms.)
+        """
+        if rows_i8 is None:
+            rows_i8, rows_scale = self._mat[:n], self._scales[:n]
+        x_i8, x_scale = self._quantize(queries)
+        if len(x_i8) < self.SGEMM_MIN_QUERIES:
+            raw = np.einsum("kd,nd->kn", x_i8, rows_i8, dtype=np.int32)
+        else:
+            raw = self._blocked_sgemm(x_i8, rows_i8)
+        # float64 like int32 * float32 gives, whichever path produced raw.
+        return np.multiply(raw, x_scale[:, None] * rows_scale[None, :],
+                           dtype=np.float64)
+
+    def _blocked_sgemm(self, x_i8: np.ndarray, rows_i8: np.ndarray) -> np.ndarray:
+        """x_i8 [K, D] @ rows_i8.T as float32, widening DEQUANT_BLOCK rows at a time."""
+        xf  = x_i8.astype(np.float32)
+        out = np.empty((len(xf), len(rows_i8)), dtype=np.float32)
+        buf = np.empty((min(self.DEQUANT_BLOCK, len(rows_i8)), xf.shape[1]),
+                       dtype=np.float32)
+        for i in range(0, len(rows_i8), self.DEQUANT_BLOCK):
+            block = rows_i8[i:i + self.DEQUANT_BLOCK]
+            wide  = buf[:len(block)]
+            wide[...] = block
+            np.matmul(xf, wide.T, out=out[:, i:i + len(block)])
+        return out
+
+    def _row_pairs(self, sims: np.ndarray, top: np.ndarray, heat=None):
+        """
+        Yield (MemoryObject, similarity, heat) for the selected index rows.
+        heat: optional per-row heat array to use instead of each memory's own.
+        """
+        for i in top:
+            mem = self._memories.get(self._ids[i])
+            if mem is not None:
+                yield mem, sims[i], mem.heat if heat is None else heat[i]
+
+    def search(self, query: str, top_k: int = 8,
+               threshold: float = 0.15, heat=None) -> list:
+        """
+        Semantic search over the in-process vector index.
+        Returns list of (MemoryObject, score) sorted descending.
+
+        FIX: threshold default changed from 0.0 to 0.15 to match
+        MemoryStore.semantic_search and avoid returning noise.
+
+        heat: optional per-row heat array (see _row_pairs) for the heat
+        weighting, e.g. MemoryStore's effective heat between decay passes.
+
+        PERF: all rows are scored with one matrix-vector product and the
+        top_k are selected with argpartition (no full sort over N).
+        """
+        n = len(self._ids)
+        if n == 0:
+            return []
+
+        sims = self._cosine(self.embed_query(query)[None, :], n=n)[0]
+
+        k = min(top_k, n)
+        if k < n:
+            top = np.argpartition(-sims, k - 1)[:k]
+        else:
+            top = np.arange(n)
+
+        return self._to_hits(self._row_pairs(sims, top, heat), threshold)
+
+    def search_batch(self, queries: list, top_k: int = 8,
+                     threshold: float = 0.15, heat=None) -> list:
+        """
+        search() for many queries at once: one [K, D] x [D, N] product.
+        Returns one hit list per query, in query order.
+        """
+        return [self._to_hits(pairs, threshold)
+                for pairs in self.neighbors_batch(queries, top_k, heat)]
+
+    def neighbors_batch(self, queries: list, top_k: int = 8,
+                        heat=None) -> list:
+        """
+        Unscored counterpart of search_batch(): per query, the top_k
+        (MemoryObject, similarity, heat) triples by raw cosine similarity,
+        most similar first, before heat weighting and threshold (_to_hits).
+        """
+        n = len(self._ids)
+        if n == 0 or not queries:
+            return [[] for _ in queries]
+
+        S = self._cosine(self._vectorize(queries), n=n)   # [K, N]
+
+        k = min(top_k, n)
+        if k < n:
+            top = np.argpartition(-S, k - 1, axis=1)[:, :k]
+        else:
+            top = np.broadcast_to(np.arange(n), S.shape)
+
+        return [sorted(self._row_pairs(S[r], top[r], heat),
+                       key=lambda x: x[1], reverse=True)
+                for r in range(len(queries))]
+
+    def score(self, query: str, memories: list,
+              threshold: float = 0.15) -> list:
+        """
+        Score query against an explicit list of memories, bypassing the index.
+        Same scoring as search(); used to rescore memories written mid-batch.
+        """
+        return self._to_hits(self.pairs(query, memories), threshold)
+
+    def pairs(self, query: str, memories: list) -> list:
+        """(MemoryObject, similarity, heat) for each of memories, unsorted."""
+        if not memories:
+            return []
+        m_i8, m_scale = self._quantize(
+            self._vectorize([m.embed_text for m in memories])
+        )
+        sims = self._cosine(self.embed_query(query)[None, :], m_i8, m_scale)[0]
+        return list(zip(memories, sims, (m.heat for m in memories)))
+
+    def heat_arrays(self) -> tuple:
+        """
+        (row ids, heat, last_recalled_turn) for every indexed memory.
+        Arrays are views into the index; callers must not write to them.
+        """
+        n = len(self._ids)
+        return self._ids, self._heat[:n], self._lrt[:n]
+
+    def heat_of(self, memory_ids: list) -> tuple:
+        """(heat, last_recalled_turn) arrays gathered for memory_ids, in order."""
+        rows = np.fromiter((self._rows[mid] for mid in memory_ids),
+                           dtype=np.intp, count=len(memory_ids))
+        return self._heat[rows], self._lrt[rows]
+
     def get_all(self) -> list:
         return list(self._memories.values())
 
@@ -149,7 +653,8 @@ class WarmTier:
         return self._memories.get(memory_id)
 
     def get_by_type(self, memory_type: MemoryType) -> list:
-        return [m for m in self._memories.values() if m.type == memory_type]
+        """O(matches) via the per-type index instead of a scan of every memory."""
+        return list(self._by_type.get(memory_type, {}).values())
 
 
 # Cold Tier: SQLite Persistent Store
@@ -162,8 +667,42 @@ class ColdTier:
     def __init__(self, db_path: str = ":memory:"):
         self.db_path = db_path
         self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        # WAL + synchronous=NORMAL: commits append to the WAL without an
+        # fsync per transaction; durability is still per checkpoint.
+        # cache_size is in KiB when negative (64 MB page cache).
+        self._conn.executescript("""
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA mmap_size=268435456;
+            PRAGMA cache_size=-65536;
+        """)
+        self._batch_depth = 0   # > 0 while inside transaction()
         self._init_schema()
 
+    @contextmanager
+    def transaction(self):
+        """
+        Group writes into one commit. upsert()/delete() skip their own commit
+        while any transaction() is open; the outermost one commits on exit.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.flush()
+
+    def flush(self):
+        """Commit any pending writes (no-op when nothing is uncommitted)."""
+        if self._conn.in_transaction:
+            self._conn.commit()
+
+    def _commit(self):
+        if not self._batch_depth:
+            self.flush()
+
     def _init_schema(self):
         self._conn.execute("""
             CREATE TABLE IF NOT EXISTS memories (
@@ -185,30 +724,67 @@ class ColdTier:
         self._conn.execute("CREATE INDEX IF NOT EXISTS idx_status ON memories(status)")
         self._conn.commit()
 
-    def upsert(self, memory: MemoryObject):
-        self._conn.execute("""
-            INSERT INTO memories
-                (memory_id, type, key_name, value, source_turn, last_recalled_turn,
-                 heat, confidence, status, embed_text, created_at, updated_at)
-            VALUES (?,?,?,?,?,?,?,?,?,?,?,?)
-            ON CONFLICT(memory_id) DO UPDATE SET
-                value              = excluded.value,
-                last_recalled_turn = excluded.last_recalled_turn,
-                heat               = excluded.heat,
-                confidence         = excluded.confidence,
-                status             = excluded.status,
-                updated_at         = excluded.updated_at
-        """, (
+    _UPSERT_SQL = """
+        INSERT INTO memories
+            (memory_id, type, key_name, value, source_turn, last_recalled_turn,
+             heat, confidence, status, embed_text, created_at, updated_at)
+        VALUES (?,?,?,?,?,?,?,?,?,?,?,?)
+        ON CONFLICT(memory_id) DO UPDATE SET
+            value              = excluded.value,
+            last_recalled_turn = excluded.last_recalled_turn,
+            heat               = excluded.heat,
+            confidence         = excluded.confidence,
+            status             = excluded.status,
+            updated_at         = excluded.updated_at
+    """
+
+    @staticmethod
+    def _params(memory: MemoryObject) -> tuple:
+        return (
             memory.memory_id, memory.type.value, memory.key, memory.value,
             memory.source_turn, memory.last_recalled_turn,
             memory.heat, memory.confidence, memory.status.value,
             memory.embed_text, memory.created_at, memory.updated_at,
-        ))
-        self._conn.commit()
+        )
+
+    def upsert(self, memory: MemoryObject):
+        self._conn.execute(self._UPSERT_SQL, self._params(memory))
+        self._commit()
+
+    def upsert_many(self, memories: list):
+        """Batched upsert(): one executemany, one commit."""
+        if not memories:
+            return
+        self._conn.executemany(self._UPSERT_SQL,
+                               [self._params(m) for m in memories])
+        self._commit()
+
+    def update_heat_many(self, memories: list):
+        """
+        Write only heat / last_recalled_turn / status (the fields a recall
+        touches): one executemany of a narrow UPDATE, one commit.
+        """
+        if not memories:
+            return
+        self._conn.executemany(
+            "UPDATE memories SET heat = ?, last_recalled_turn = ?, status = ? "
+            "WHERE memory_id = ?",
+            [(m.heat, m.last_recalled_turn, m.status.value, m.memory_id)
+             for m in memories],
+        )
+        self._commit()
 
     def delete(self, memory_id: str):
         self._conn.execute("DELETE FROM memories WHERE memory_id = ?", (memory_id,))
-        self._conn.commit()
+        self._commit()
+
+    def delete_many(self, memory_ids: list):
+        """Batched delete(): one executemany, one commit."""
+        if not memory_ids:
+            return
+        self._conn.executemany("DELETE FROM memories WHERE memory_id = ?",
+                               [(mid,) for mid in memory_ids])
+        self._commit()
 
     def get_by_type(self, memory_type: MemoryType) -> list:
         rows = self._conn.execute(
@@ -240,7 +816,35 @@ class ColdTier:
         )
 
     def export_all(self) -> list:
-        return [m.to_dict() for m in self.get_all_active()]
+        """
+        to_dict() of every active/decaying memory, built straight from the
+        rows -- no MemoryObject or Enum construction per row.
+        """
+        # Rounded in Python, not SQL: SQLite's round() rounds the decimal
+        # value half away from zero, to_dict()'s round() the binary value.
+        rows = self._conn.execute("""
+            SELECT memory_id, type, key_name, value, source_turn,
+                   last_recalled_turn, heat, confidence,
+                   status, created_at, updated_at
+            FROM memories WHERE status IN ('active', 'decaying')
+        """).fetchall()
+        return [
+            {
+                "memory_id":          mid,
+                "type":               mtype,
+                "key":                key,
+                "value":              value,
+                "source_turn":        source_turn,
+                "last_recalled_turn": last_recalled,
+                "heat":               round(heat, 3),
+                "confidence":         round(confidence, 3),
+                "status":             status,
+                "created_at":         created_at,
+                "updated_at":         updated_at,
+            }
+            for (mid, mtype, key, value, source_turn, last_recalled,
+                 heat, confidence, status, created_at, updated_at) in rows
+        ]
 
 
 # Unified Memory Store
@@ -250,12 +854,16 @@ class MemoryStore:
     HEAT_RECALL_BOOST    = 0.25
     HEAT_EVICT_THRESHOLD = 0.08
 
+    # apply_decay's status class (0/1/2) -> MemoryStatus
+    _DECAY_STATUS = (MemoryStatus.EVICTED, MemoryStatus.DECAYING, MemoryStatus.ACTIVE)
+
     def __init__(self, db_path: str = ":memory:"):
         self.db_path = db_path
 
         # Derive isolated ChromaDB path and collection name from db_path.
+        # ":memory:" persists nothing, so the warm tier skips Chroma entirely.
         if db_path == ":memory:":
-            chroma_path     = "mnemosyne_chroma_ephemeral"
+            chroma_path     = None
             collection_name = "mem_ephemeral"
         else:
             base            = db_path.replace(".db", "")
@@ -269,53 +877,207 @@ class MemoryStore:
         )
         self.cold = ColdTier(db_path)
 
+        # (key, type) -> MemoryObject for every non-evicted warm memory.
+        # Maintained incrementally by every write path so Curator never has
+        # to rebuild it with a full scan.
+        self._active_by_key: dict = {}
+
+        # Turn of the last apply_decay() pass. Decay may run only every few
+        # turns; each pass catches up on every turn it skipped.
+        self._last_decay_turn = 0
+
         # Sync persisted SQLite memories back into ChromaDB warm tier on startup.
-        # upsert() is idempotent -- safe even if Chroma already has these IDs.
-        for m in self.cold.get_all_active():
-            self.warm.upsert(m)
+        # Reuses vectors Chroma already has; upsert is idempotent for the rest.
+        persisted = self.cold.get_all_active()
+        self.warm.load(persisted)
+        for m in persisted:
+            self._index_key(m)
+
+    # Key Index
+
+    def _index_key(self, memory: MemoryObject):
+        self._active_by_key[(memory.key, memory.type)] = memory
+
+    def _unindex_key(self, memory: MemoryObject):
+        # Only drop the entry if it still points at this memory.
+        k = (memory.key, memory.type)
+        if self._active_by_key.get(k) is memory:
+            del self._active_by_key[k]
+
+    def active_by_key_view(self) -> dict:
+        """Live (key, type) -> MemoryObject mapping of active + decaying memories."""
+        return self._active_by_key
 
     # Write Operations
 
+    def transaction(self):
+        """Context manager: all cold-tier writes inside commit once on exit."""
+        return self.cold.transaction()
+
+    def flush(self):
+        """Wait for queued Chroma writes and commit pending cold-tier writes."""
+        self.warm.flush()
+        self.cold.flush()
+
+    def close(self):
+        """flush(), then stop the warm tier's writer thread."""
+        self.warm.close()
+        self.cold.flush()
+
     def add(self, memory: MemoryObject):
         self.hot.add(memory)
         self.warm.upsert(memory)
         self.cold.upsert(memory)
+        self._index_key(memory)
 
-    def update(self, memory_id: str, new_value: str, turn: int):
+    def update(self, memory_id: str, new_value: str, turn: int,
+               now: Optional[float] = None):
+        """now: wall-clock stamp for updated_at; batch callers pass one."""
         mem = self.warm.get_by_id(memory_id)
         if mem is None:
             mem = self.cold.get_by_id(memory_id)
         if mem is None:
             return
+        self._settle_decay(mem, turn - 1)
         mem.value      = new_value
-        mem.updated_at = time.time()
+        mem.refresh_token_est()
+        mem.updated_at = time.time() if now is None else now
         mem.last_recalled_turn = turn
         mem.embed_text = f"{mem.key}: {new_value}"
         self.warm.upsert(mem)
         self.cold.upsert(mem)
+        self._index_key(mem)
 
     def delete(self, memory_id: str):
+        mem = self.warm.get_by_id(memory_id)
+        if mem is not None:
+            self._unindex_key(mem)
         self.warm.remove(memory_id)
         self.cold.delete(memory_id)
 
     def mark_recalled(self, memory_id: str, turn: int):
-        mem = self.warm.get_by_id(memory_id)
-        if mem:
-            mem.heat = min(1.0, mem.heat + self.HEAT_RECALL_BOOST)
-            mem.last_recalled_turn = turn
-            mem.status = MemoryStatus.ACTIVE
-            self.warm.upsert(mem)
-            self.cold.upsert(mem)
+        self.mark_recalled_many([memory_id], turn)
+
+    def mark_recalled_many(self, memory_ids: list, turn: int):
+        """
+        Heat boost for every memory recalled this turn.
+
+        A memory whose settled heat is already below HEAT_EVICT_THRESHOLD
+        would have been evicted by a per-turn decay pass, so it is evicted
+        here instead of being revived by the boost.
+
+        PERF: a recall only moves heat / last_recalled_turn / status, so the
+        vector is left alone: warm gets one metadata-only Chroma update
+        (embed_text unchanged -> no re-embedding) and cold one executemany.
+        """
+        recalled = []
+        evicted  = []
+        for memory_id in memory_ids:
+            mem = self.warm.get_by_id(memory_id)
+            if mem:
+                self._settle_decay(mem, turn - 1)
+                if mem.heat < self.HEAT_EVICT_THRESHOLD:
+                    mem.status = MemoryStatus.EVICTED
+                    self._unindex_key(mem)
+                    evicted.append(mem.memory_id)
+                    continue
+                mem.heat = min(1.0, mem.heat + self.HEAT_RECALL_BOOST)
+                mem.last_recalled_turn = turn
+                mem.status = MemoryStatus.ACTIVE
+                recalled.append(mem)
+        self.warm.remove_many(evicted)
+        self.warm.upsert_many(recalled)
+        with self.cold.transaction():
+            self.cold.delete_many(evicted)
+            self.cold.update_heat_many(recalled)
+
+    def evict_dead(self, memory_ids: list, turn: int) -> list:
+        """
+        Evict the memories among memory_ids whose effective heat through
+        turn - 1 is below HEAT_EVICT_THRESHOLD: a per-turn decay pass would
+        already have evicted them. Same check as mark_recalled_many, for
+        callers (Curator) about to treat them as live. Returns evicted ids.
+        """
+        ids = [mid for mid in dict.fromkeys(memory_ids)
+               if self.warm.get_by_id(mid) is not None]
+        if not ids:
+            return []
+        heat, _ = self.heat_of(ids, upto_turn=turn - 1)
+        evicted = []
+        for memory_id, h in zip(ids, heat.tolist()):
+            if h < self.HEAT_EVICT_THRESHOLD:
+                mem = self.warm.get_by_id(memory_id)
+                mem.heat   = h
+                mem.status = MemoryStatus.EVICTED
+                self._unindex_key(mem)
+                evicted.append(memory_id)
+        self.warm.remove_many(evicted)
+        self.cold.delete_many(evicted)
+        return evicted
 
     # Read Operations
 
     def semantic_search(self, query: str, top_k: int = 6,
-                        threshold: float = 0.15) -> list:
-        return self.warm.search(query, top_k=top_k, threshold=threshold)
+                        threshold: float = 0.15,
+                        upto_turn: Optional[int] = None) -> list:
+        """upto_turn: weight hits by effective heat through that turn (see heat_of)."""
+        return self.warm.search(query, top_k=top_k, threshold=threshold,
+                                heat=self._row_heat(upto_turn))
+
+    def semantic_search_batch(self, queries: list, top_k: int = 6,
+                              threshold: float = 0.15,
+                              upto_turn: Optional[int] = None) -> list:
+        return self.warm.search_batch(queries, top_k=top_k, threshold=threshold,
+                                      heat=self._row_heat(upto_turn))
+
+    def semantic_score(self, query: str, memories: list,
+                       threshold: float = 0.15) -> list:
+        return self.warm.score(query, memories, threshold=threshold)
+
+    def semantic_neighbors_batch(self, queries: list, top_k: int = 6,
+                                 upto_turn: Optional[int] = None) -> list:
+        """
+        Raw (MemoryObject, similarity, heat) neighbors per query, most
+        similar first; rank_neighbors() turns a list into scored hits.
+        """
+        return self.warm.neighbors_batch(queries, top_k=top_k,
+                                         heat=self._row_heat(upto_turn))
+
+    def semantic_pairs(self, query: str, memories: list) -> list:
+        return self.warm.pairs(query, memories)
+
+    def rank_neighbors(self, neighbors: list, threshold: float = 0.15) -> list:
+        """Heat-weight, threshold and sort raw neighbors like semantic_search."""
+        return self.warm._to_hits(neighbors, threshold)
 
     def get_by_type(self, memory_type: MemoryType) -> list:
         return self.warm.get_by_type(memory_type)
 
+    def heat_of(self, memory_ids: list,
+                upto_turn: Optional[int] = None) -> tuple:
+        """
+        (heat, last_recalled_turn) arrays for warm memory_ids, in order.
+        With upto_turn, heat is the effective value: minus the decay owed
+        through upto_turn that the next apply_decay() pass will charge.
+        """
+        heat, lrt = self.warm.heat_of(memory_ids)
+        if upto_turn is not None:
+            heat = self._decayed(heat, lrt, upto_turn)
+        return heat, lrt
+
+    def _decayed(self, heat: np.ndarray, lrt: np.ndarray,
+                 upto_turn: int) -> np.ndarray:
+        """heat minus the decay owed through upto_turn since the last pass."""
+        pending = np.maximum(0, upto_turn - np.maximum(lrt, self._last_decay_turn))
+        return np.maximum(0.0, heat - self.HEAT_DECAY_PER_TURN * pending)
+
+    def _row_heat(self, upto_turn: Optional[int]) -> Optional[np.ndarray]:
+        """Effective heat of every warm index row, or None for stored heat."""
+        if upto_turn is None:
+            return None
+        _, heat, lrt = self.warm.heat_arrays()
+        return self._decayed(heat, lrt, upto_turn)
+
     def get_all_active(self) -> list:
         return [m for m in self.warm.get_all()
                 if m.status != MemoryStatus.EVICTED]
@@ -325,28 +1087,61 @@ class MemoryStore:
 
     # Decay Pass
 
+    def _pending_decay_turns(self, mem: MemoryObject, upto_turn: int) -> int:
+        """Turns in (last pass or last recall, upto_turn] that mem was not recalled."""
+        return max(0, upto_turn - max(mem.last_recalled_turn, self._last_decay_turn))
+
+    def _settle_decay(self, mem: MemoryObject, upto_turn: int):
+        """
+        Apply decay owed since the last pass before last_recalled_turn moves,
+        so a recall/update between passes doesn't erase earlier unrecalled turns.
+        """
+        pending = self._pending_decay_turns(mem, upto_turn)
+        if pending:
+            mem.heat = max(0.0, mem.heat - self.HEAT_DECAY_PER_TURN * pending)
+
     def apply_decay(self, current_turn: int) -> list:
         """
-        Subtract HEAT_DECAY_PER_TURN from all memories not recalled this turn.
+        Subtract HEAT_DECAY_PER_TURN for every turn since the previous pass on
+        which a memory was not recalled. With a pass every turn this is the
+        classic per-turn decay; with a pass every N turns it decays the same
+        total amount in one go.
         Returns list of evicted memory_ids.
-        Iterates list() copy of warm._memories -- safe against mutation.
         """
         evicted = []
-        for mem in self.warm.get_all():   # get_all() returns a list copy
-            if mem.last_recalled_turn < current_turn:
-                mem.heat = max(0.0, mem.heat - self.HEAT_DECAY_PER_TURN)
-
-                if mem.heat < self.HEAT_EVICT_THRESHOLD:
-                    mem.status = MemoryStatus.EVICTED
-                    self.warm.remove(mem.memory_id)
-                    self.cold.delete(mem.memory_id)
-                    evicted.append(mem.memory_id)
-                elif mem.heat < 0.3:
-                    mem.status = MemoryStatus.DECAYING
-                    self.warm.upsert(mem)
-                    self.cold.upsert(mem)
-                else:
-                    mem.status = MemoryStatus.ACTIVE
-                    self.warm.upsert(mem)
-                    self.cold.upsert(mem)
-        return evicted
\ No newline at end of file
+        changed = []   # decaying + active memories whose heat/status moved
+
+        # Vectorised over the warm tier's heat/recency arrays; only memories
+        # that actually owe decay are touched as Python objects.
+        ids, heat, lrt = self.warm.heat_arrays()
+        pending  = np.maximum(0, current_turn - np.maximum(lrt, self._last_decay_turn))
+        rows     = np.flatnonzero(pending)
+        new_heat = np.maximum(0.0, heat[rows] - self.HEAT_DECAY_PER_TURN * pending[rows])
+        status   = np.where(new_heat < self.HEAT_EVICT_THRESHOLD, 0,
+                            np.where(new_heat < 0.3, 1, 2))
+
+        # Heat already at its floor: nothing moved, so nothing to write.
+        moved = new_heat != heat[rows]
+
+        for row, h, st, mv in zip(rows.tolist(), new_heat.tolist(),
+                                  status.tolist(), moved.tolist()):
+            mem        = self.warm.get_by_id(ids[row])
+            new_status = self._DECAY_STATUS[st]
+            if not mv and mem.status is new_status:
+                continue
+            mem.heat   = h
+            mem.status = new_status
+            if new_status is MemoryStatus.EVICTED:
+                self._unindex_key(mem)
+                evicted.append(mem.memory_id)
+            else:
+                changed.append(mem)
+
+        # One batched write per tier instead of one per memory.
+        self.warm.remove_many(evicted)
+        self.warm.upsert_many(changed)
+        with self.cold.transaction():
+            self.cold.delete_many(evicted)
+            self.cold.upsert_many(changed)
+        self._last_decay_turn = current_turn
+        return evicted
@@ -31,10 +31,11 @@ class CuratorOp(str, Enum):
 
 # Core Memory Object
 
-@dataclass
+@dataclass(slots=True)
 class MemoryObject:
     """
     A single unit of memory. Every memory the system holds is one of these.
+    slots=True: no per-instance __dict__, thousands of these live at once.
     """
     memory_id:         str          = field(default_factory=lambda: f"mem_{uuid.uuid4().hex[:8]}")
     type:              MemoryType   = MemoryType.FACT
@@ -45,14 +46,34 @@ class MemoryObject:
     heat:              float        = 1.0         # 0.0–1.0 decay score
     confidence:        float        = 1.0         # Sentinel extraction confidence
     status:            MemoryStatus = MemoryStatus.ACTIVE
-    created_at:        float        = field(default_factory=time.time)
-    updated_at:        float        = field(default_factory=time.time)
+    created_at:        float        = 0.0         # 0.0 -> stamped in __post_init__
+    updated_at:        float        = 0.0         # 0.0 -> created_at
     # Embedding is stored separately in the warm tier; this is the raw text for embedding
     embed_text:        str          = ""
+    # Oracle's token estimate for to_prompt_fragment(); kept by refresh_token_est()
+    _token_est:        int          = field(default=0, init=False, repr=False, compare=False)
 
     def __post_init__(self):
+        # One clock read per object (the old per-field default_factory read
+        # it twice, so created_at and updated_at disagreed by a few µs).
+        if not self.created_at:
+            self.created_at = time.time()
+        if not self.updated_at:
+            self.updated_at = self.created_at
         if not self.embed_text:
             self.embed_text = f"{self.key}: {self.value}"
+        self.refresh_token_est()
+
+    def refresh_token_est(self):
+        """Recompute _token_est; call after changing key or value."""
+        # Same count as len(to_prompt_fragment().split()) + 3: the
+        # "[TYPE]" tag is one word, plus 3 tokens of slack.
+        self._token_est = len(f"{self.key}: {self.value}".split()) + 4
+
+    @property
+    def token_est(self) -> int:
+        """Cached token estimate for to_prompt_fragment() (read-only)."""
+        return self._token_est
 
     def to_dict(self) -> dict:
         return {
@@ -75,7 +96,7 @@ class MemoryObject:
     
 # Extraction Result (Sentinel Output)
 
-@dataclass
+@dataclass(slots=True)
 class ExtractionResult:
     candidates : list
     raw_turn : str
@@ -85,7 +106,7 @@ class ExtractionResult:
 
 # Retrieval Result (Oracle Output)
 
-@dataclass
+@dataclass(slots=True)
 class RetrievalResult:
     memories:         list   # list of MemoryObject
     total_tokens:     int    = 0
@@ -96,7 +117,7 @@ class RetrievalResult:
 
 # Curator Decision
 
-@dataclass
+@dataclass(slots=True)
 class CuratorDecision:
     operation:    CuratorOp
     candidate:    object  # MemoryObject
@@ -11,7 +11,11 @@ Strategy:
   6. Mark all retrieved memories as recalled (heat boost)
 """
 
-from .models import MemoryObject, MemoryType, MemoryStatus, RetrievalResult
+from collections import defaultdict
+
+import numpy as np
+
+from .models import MemoryType, MemoryStatus, RetrievalResult
 from .memory_store import MemoryStore
 
 
@@ -26,6 +30,16 @@ ALWAYS_INJECT_TYPES = [        # these types always get injected regardless of s
 ]
 TOP_K_SEMANTIC      = 8        # how many semantic candidates to consider
 
+# Prompt block layout: group order and per-group headers, built once.
+_PRIORITY = (
+    MemoryType.CONSTRAINT.value,
+    MemoryType.COMMITMENT.value,
+    MemoryType.PREFERENCE.value,
+    MemoryType.FACT.value,
+    MemoryType.ENTITY.value,
+)
+_GROUP_HEADER = {t: f"  [{t.upper()}S]" for t in _PRIORITY}
+
 
 # Oracle Agent
 
@@ -34,11 +48,31 @@ class Oracle:
     Layer 3: Retrieves the most relevant memories for a given turn.
     Output is a compact prompt block injected before the LLM call.
 
+    Semantic and structural lookups run inline, one after the other: the
+    structural lookup is an O(matches) per-type index read, far cheaper
+    than a thread hand-off, so running them concurrently was a net loss.
     """
 
     def __init__(self, store: MemoryStore):
         self.store = store
 
+    def _semantic(self, query: str, turn_number: int) -> list:
+        # Heat weighting net of decay owed through last turn, as in step 3.
+        return self.store.semantic_search(
+            query=query,
+            top_k=TOP_K_SEMANTIC,
+            threshold=RELEVANCE_THRESHOLD,
+            upto_turn=turn_number - 1,
+        )
+
+    def _structural(self) -> list:
+        return [
+            mem
+            for mem_type in ALWAYS_INJECT_TYPES
+            for mem in self.store.get_by_type(mem_type)
+            if mem.status != MemoryStatus.EVICTED
+        ]
+
     def retrieve(self, query: str, turn_number: int) -> RetrievalResult:
         """
         Main retrieval method. Returns a RetrievalResult containing:
@@ -47,54 +81,53 @@ class Oracle:
           - stats: semantic_hits, structural_hits, total_tokens
         """
         selected: dict = {}   # memory_id → MemoryObject (deduplication map)
-        semantic_hits   = 0
-        structural_hits = 0
 
         # Step 1: Semantic Search
-        semantic_results = self.store.semantic_search(
-            query=query,
-            top_k=TOP_K_SEMANTIC,
-            threshold=RELEVANCE_THRESHOLD,
-        )
-        for mem, score in semantic_results:
+        semantic_ids = set()
+        for mem, score in self._semantic(query, turn_number):
             if mem.memory_id not in selected:
                 selected[mem.memory_id] = mem
-                semantic_hits += 1
+                semantic_ids.add(mem.memory_id)
 
         # Step 2: Structural Search (always-inject types)
-        for mem_type in ALWAYS_INJECT_TYPES:
-            type_memories = self.store.get_by_type(mem_type)
-            for mem in type_memories:
-                if mem.status != MemoryStatus.EVICTED:
-                    if mem.memory_id not in selected:
-                        selected[mem.memory_id] = mem
-                        structural_hits += 1
-
-        # Step 3: Sort by relevance (heat * recency)
-        def relevance_score(mem: MemoryObject) -> float:
-            recency = 1.0 / (1.0 + (turn_number - mem.last_recalled_turn) * 0.01)
-            return mem.heat * 0.6 + recency * 0.4
-
-        sorted_memories = sorted(
-            selected.values(),
-            key=relevance_score,
-            reverse=True,
-        )
+        for mem in self._structural():
+            if mem.memory_id not in selected:
+                selected[mem.memory_id] = mem
+
+        # Step 3: Sort by relevance (heat * recency), scored in one NumPy pass
+        # over the warm tier's heat/recency arrays. Stable order on ties,
+        # like sorted(..., reverse=True).
+        # Decay runs only every few turns, so heat is taken net of the decay
+        # owed through last turn; memories a per-turn pass would already have
+        # evicted are dropped rather than injected (and revived by recall).
+        candidates = list(selected.values())
+        if candidates:
+            heat, lrt = self.store.heat_of(list(selected), upto_turn=turn_number - 1)
+            recency   = 1.0 / (1.0 + (turn_number - lrt) * 0.01)
+            relevance = heat * 0.6 + recency * 0.4
+            order     = np.argsort(-relevance, kind="stable")
+            live      = heat >= self.store.HEAT_EVICT_THRESHOLD
+            sorted_memories = [candidates[i] for i in order.tolist() if live[i]]
+        else:
+            sorted_memories = []
+
+        semantic_hits   = sum(1 for m in sorted_memories if m.memory_id in semantic_ids)
+        structural_hits = len(sorted_memories) - semantic_hits
 
         # Step 4: Apply Token Budget
         final_memories = []
         total_tokens   = 0
         for mem in sorted_memories:
-            fragment         = mem.to_prompt_fragment()
-            estimated_tokens = len(fragment.split()) + 3   # rough token estimate
+            estimated_tokens = mem.token_est   # rough token estimate, cached
             if total_tokens + estimated_tokens > MAX_MEMORY_TOKENS:
                 break
             final_memories.append(mem)
             total_tokens += estimated_tokens
 
-        # Step 5: Mark recalled (heat boost)
-        for mem in final_memories:
-            self.store.mark_recalled(mem.memory_id, turn_number)
+        # Step 5: Mark recalled (heat boost) -- one batched write per tier
+        self.store.mark_recalled_many(
+            [mem.memory_id for mem in final_memories], turn_number
+        )
 
         # Step 6: Build prompt block
         prompt_block = self._build_prompt_block(final_memories)
@@ -115,26 +148,16 @@ class Oracle:
         if not memories:
             return ""
 
-        groups: dict = {}
+        groups = defaultdict(list)
         for mem in memories:
-            t = mem.type.value
-            if t not in groups:
-                groups[t] = []
-            groups[t].append(mem)
+            groups[mem.type.value].append(mem)
 
         lines = ["<memory_context>"]
-        priority_order = [
-            MemoryType.CONSTRAINT.value,
-            MemoryType.COMMITMENT.value,
-            MemoryType.PREFERENCE.value,
-            MemoryType.FACT.value,
-            MemoryType.ENTITY.value,
-        ]
-        for type_key in priority_order:
-            if type_key in groups:
-                lines.append(f"  [{type_key.upper()}S]")
-                for mem in groups[type_key]:
-                    lines.append(f"    {mem.key}: {mem.value}")
+        for type_key in _PRIORITY:
+            group = groups.get(type_key)
+            if group:
+                lines.append(_GROUP_HEADER[type_key])
+                lines.extend([f"    {mem.key}: {mem.value}" for mem in group])
 
         lines.append("</memory_context>")
         return "\n".join(lines)
@@ -4,6 +4,7 @@ UPGRADED: Uses Gemini 2.5 Flash for intelligent, semantic memory extraction.
 """
 
 import json
+import time
 import google.generativeai as genai
 from typing import Optional
 from .models import MemoryObject, MemoryType, ExtractionResult
@@ -11,6 +12,9 @@ from .models import MemoryObject, MemoryType, ExtractionResult
 # CONFIGURATION
 CONFIDENCE_THRESHOLD = 0.60
 
+# type string -> MemoryType, built once instead of per extracted item
+_VALID_TYPES = {t.value: t for t in MemoryType}
+
 SYSTEM_PROMPT = """
 You are a Memory Extraction Sentinel. Your goal is to extract strictly factual information, user preferences, and constraints from the user's latest message.
 
@@ -73,16 +77,15 @@ class Sentinel:
             data = json.loads(raw_text)
             raw_memories = data.get("memories", [])
 
-            # 3. Convert to internal MemoryObject format
+            # 3. Convert to internal MemoryObject format (one timestamp
+            #    for the whole extraction)
+            now = time.time()
             for item in raw_memories:
                 try:
-                    # Validate Type
-                    mem_type_str = item.get("type", "fact").lower()
-                    # Map common LLM mistakes to valid enums if necessary
-                    if mem_type_str not in [t.value for t in MemoryType]:
-                        mem_type_str = "fact"
-                    
-                    mem_type = MemoryType(mem_type_str)
+                    # Validate Type (unknown types fall back to fact)
+                    mem_type = _VALID_TYPES.get(
+                        item.get("type", "fact").lower(), MemoryType.FACT
+                    )
                     
                     # Create Object
                     conf = float(item.get("confidence", 0.0))
@@ -94,6 +97,8 @@ class Sentinel:
                         last_recalled_turn=turn_number,
                         heat=min(1.0, conf),
                         confidence=conf,
+                        created_at=now,
+                        updated_at=now,
                     )
                     candidates.append(mem)
                 except Exception as e:
@@ -0,0 +1,40 @@
+"""
+Shared fixtures.
+
+The default Chroma embedder downloads MiniLM on first use, so every test
+runs against a deterministic bag-of-words stand-in instead: same
+dimension, no network, and texts that share words still land close
+together.
+"""
+
+import hashlib
+
+import pytest
+
+EMBED_DIM = 384
+
+
+def fake_embed(texts: list) -> list:
+    """Hash each lower-cased word into one of EMBED_DIM buckets."""
+    np = pytest.importorskip("numpy")
+    out = []
+    for text in texts:
+        vec = np.zeros(EMBED_DIM, dtype=np.float32)
+        for word in text.lower().replace("?", " ").replace(":", " ").split():
+            vec[int(hashlib.md5(word.encode()).hexdigest(), 16) % EMBED_DIM] += 1.0
+        vec[0] += 0.01   # never all-zero, even for empty text
+        out.append(vec)
+    return out
+
+
+@pytest.fixture(autouse=True)
+def offline_embedder(monkeypatch):
+    pytest.importorskip("numpy")
+    pytest.importorskip("chromadb")
+    pytest.importorskip("google.generativeai")
+    from mnemosyne.memory_store import WarmTier
+
+    monkeypatch.setattr(WarmTier, "_EMBED_FN", staticmethod(fake_embed))
+    WarmTier.clear_embedding_cache()
+    yield
+    WarmTier.clear_embedding_cache()
@@ -0,0 +1,103 @@
+"""
+Curator: LLM response parsing, decay-aware matching and batched neighbors.
+"""
+
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("chromadb")
+pytest.importorskip("google.generativeai")
+
+from mnemosyne.curator import (
+    SEMANTIC_NEIGHBORS, SIMILARITY_FOR_CONFLICT, _FENCE_RE,
+)
+from mnemosyne.models import CuratorOp, MemoryObject, MemoryType
+
+PAYLOAD = '{"operation": "UPDATE", "target_id": "mem_1", "reason": "x`y"}'
+
+
+@pytest.mark.parametrize("response", [
+    PAYLOAD,
+    f"```json\n{PAYLOAD}\n```",
+    f"```\n{PAYLOAD}\n```",
+    f"```json{PAYLOAD}```",
+])
+def test_fence_re_strips_only_the_fences(response):
+    assert _FENCE_RE.sub("", response.strip()) == PAYLOAD
+
+
+def test_parse_llm_decision_reads_fenced_json(store_curator):
+    candidate = MemoryObject(key="home_city", value="Lives in Pune")
+
+    decision = store_curator.parse_llm_decision(f"```json\n{PAYLOAD}\n```", candidate)
+
+    assert decision.operation is CuratorOp.UPDATE
+    assert decision.target_id == "mem_1"
+    assert decision.reason == "x`y"
+
+
+@pytest.fixture
+def store_curator():
+    from mnemosyne.curator import Curator
+    from mnemosyne.memory_store import MemoryStore
+
+    store = MemoryStore(db_path=":memory:")
+    yield Curator(store=store)
+    store.close()
+
+
+# Decay between passes
+
+@pytest.mark.parametrize("value", ["Lives in Pune", "Lives in Mumbai"])
+def test_restating_a_memory_decay_already_killed_adds_it_fresh(store_curator, value):
+    # Per-turn decay evicts the turn-1 memory at turn 22; the pass every
+    # DECAY_INTERVAL turns has not run yet when it is re-stated at turn 26.
+    curator = store_curator
+    store   = curator.store
+    old = MemoryObject(key="home_city", value="Lives in Pune", heat=0.9,
+                       source_turn=1, last_recalled_turn=1)
+    store.add(old)
+    for turn in range(2, 26):
+        curator.run_decay(turn)
+
+    new = MemoryObject(key="home_city", value=value, heat=0.74,
+                       source_turn=26, last_recalled_turn=26)
+    decisions = curator.process([new], 26)
+    for turn in range(26, 31):
+        curator.run_decay(turn)
+
+    assert [d.operation for d in decisions] == [CuratorOp.ADD]
+    assert store.warm.get_by_id(old.memory_id) is None
+    assert [m.memory_id for m in store.get_snapshot()] == [new.memory_id]
+    assert new.heat == pytest.approx(0.74 - 4 * store.HEAT_DECAY_PER_TURN)
+
+
+# Batched neighbors
+
+def test_batched_neighbors_match_per_candidate_search(store_curator):
+    curator = store_curator
+    store   = curator.store
+    # Cold near-duplicates and one hot, slightly less similar memory: the
+    # top SEMANTIC_NEIGHBORS must be picked by raw similarity, not by score.
+    for value, heat in [("lives in pune city", 0.1), ("lives in pune", 0.1),
+                        ("lives in pune centre", 0.1), ("lives near pune now", 1.0),
+                        ("works in pune", 0.5), ("plays chess", 0.9)]:
+        store.add(MemoryObject(key="home", value=value, heat=heat,
+                               type=MemoryType.ENTITY))
+    candidates = [MemoryObject(key="home_city", value=v)
+                  for v in ("lives in pune", "works near pune", "plays chess")]
+    neighbors  = curator._live_neighbors(candidates, 1, store.active_by_key_view())
+
+    # A memory written mid-turn is rescored instead of looked up.
+    written = MemoryObject(key="home_town", value="lives in pune city centre")
+    store.add(written)
+    touched = {written.memory_id: written}
+
+    for candidate, similar in zip(candidates, neighbors):
+        batched    = curator._fresh_neighbors(candidate, similar, touched)
+        sequential = store.semantic_search(candidate.embed_text,
+                                           top_k=SEMANTIC_NEIGHBORS,
+                                           threshold=SIMILARITY_FOR_CONFLICT,
+                                           upto_turn=0)
+        assert [(m.memory_id, pytest.approx(s)) for m, s in batched] == \
+               [(m.memory_id, s) for m, s in sequential]
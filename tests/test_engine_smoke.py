@@ -0,0 +1,43 @@
+"""
+End-to-end smoke tests for MnemosyneEngine.
+
+No llm_fn and no Gemini key: the engine answers with its stub reply and
+Sentinel extraction fails soft, so these exercise Oracle retrieval, the
+warm-tier vector index and the background memory worker against a real
+(ephemeral) store. conftest.py swaps in an offline embedder.
+"""
+
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("chromadb")
+pytest.importorskip("google.generativeai")
+
+from mnemosyne.engine import MnemosyneEngine
+from mnemosyne.models import MemoryType
+
+
+@pytest.fixture
+def engine():
+    eng = MnemosyneEngine(db_path=":memory:")
+    yield eng
+    eng.close()
+
+
+def test_chat_inject_chat_uses_memory(engine):
+    engine.chat("Hi there")
+    mem = engine.inject_memory("dietary_restriction", "Vegan",
+                               mem_type=MemoryType.CONSTRAINT)
+
+    result = engine.chat("What should I cook tonight?")
+
+    assert mem.memory_id in [m.memory_id for m in result.memories_used]
+    assert "dietary_restriction: Vegan" in result.prompt_block
+
+
+def test_semantic_search_finds_injected_fact(engine):
+    mem = engine.inject_memory("home_city", "Lives in Pune")
+
+    hits = engine.store.semantic_search("Which city do I live in?")
+
+    assert [m.memory_id for m, _ in hits][:1] == [mem.memory_id]
@@ -0,0 +1,235 @@
+"""
+Focused tests for the memory tiers: vector index, key index, decay and
+cold-tier export. Stores are ephemeral (":memory:") unless a test needs
+Chroma's background writer.
+"""
+
+import gc
+import weakref
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("chromadb")
+pytest.importorskip("google.generativeai")
+
+from mnemosyne.memory_store import ColdTier, HotTier, MemoryStore, WarmTier
+from mnemosyne.models import MemoryObject, MemoryStatus, MemoryType
+
+FACTS = [
+    ("home_city",     "Lives in Pune"),
+    ("employer",      "Works at a robotics startup"),
+    ("pet",           "Has a beagle called Momo"),
+    ("language",      "Prefers Python over Java"),
+    ("diet",          "Vegetarian, no eggs"),
+    ("commute",       "Cycles to work every day"),
+    ("sibling",       "Older sister lives in Delhi"),
+    ("hobby",         "Plays chess on weekends"),
+]
+
+QUERIES = [
+    "Which city do I live in?",
+    "Where do I work?",
+    "What is my dog called?",
+    "Which language do I prefer?",
+    "What can I eat?",
+]
+
+
+@pytest.fixture
+def store():
+    s = MemoryStore(db_path=":memory:")
+    yield s
+    s.close()
+
+
+def _fill(store, heat=0.9):
+    mems = [MemoryObject(key=k, value=v, heat=heat) for k, v in FACTS]
+    for m in mems:
+        store.add(m)
+    return mems
+
+
+# Vector index
+
+@pytest.mark.parametrize("n_queries", [2, len(QUERIES)])
+def test_batch_search_matches_sequential(store, n_queries):
+    # 2 queries take the int32 einsum path, 5 the blocked SGEMM path.
+    _fill(store)
+    queries = QUERIES[:n_queries]
+
+    batch = store.semantic_search_batch(queries, top_k=3, threshold=0.0)
+
+    for query, hits in zip(queries, batch):
+        single = store.semantic_search(query, top_k=3, threshold=0.0)
+        assert [m.memory_id for m, _ in hits] == [m.memory_id for m, _ in single]
+        assert [s for _, s in hits] == pytest.approx([s for _, s in single])
+
+
+def test_int8_cosine_tracks_float32(store):
+    _fill(store)
+    warm  = store.warm
+    rows  = warm._vectorize([m.embed_text for m in warm.get_all()])
+    order = [warm._rows[m.memory_id] for m in warm.get_all()]
+    q     = warm._vectorize(QUERIES)
+
+    exact = q @ rows.T
+    approx = warm._cosine(q, n=len(order))[:, order]
+
+    assert np.abs(approx - exact).max() < 0.02
+
+
+def test_sgemm_path_is_bit_identical_to_einsum(store):
+    _fill(store)
+    warm = store.warm
+    q    = warm._vectorize(QUERIES)
+    n    = len(warm._ids)
+    assert len(q) >= warm.SGEMM_MIN_QUERIES
+
+    blocked = warm._cosine(q, n=n)
+    einsum  = np.vstack([warm._cosine(q[i:i + 1], n=n) for i in range(len(q))])
+
+    np.testing.assert_array_equal(blocked, einsum)
+
+
+# Key index
+
+def test_active_by_key_follows_every_write_path(store):
+    index = store.active_by_key_view()
+    mem = MemoryObject(key="home_city", value="Lives in Pune", heat=0.2,
+                       type=MemoryType.FACT)
+
+    store.add(mem)
+    assert index[("home_city", MemoryType.FACT)] is mem
+
+    store.update(mem.memory_id, "Lives in Mumbai", turn=1)
+    assert index[("home_city", MemoryType.FACT)].value == "Lives in Mumbai"
+
+    store.delete(mem.memory_id)
+    assert ("home_city", MemoryType.FACT) not in index
+
+    doomed = MemoryObject(key="pet", value="Has a cat", heat=0.1)
+    store.add(doomed)
+    assert store.apply_decay(current_turn=5) == [doomed.memory_id]
+    assert ("pet", MemoryType.FACT) not in index
+
+
+def test_delete_of_replaced_memory_keeps_newer_entry(store):
+    old = MemoryObject(key="home_city", value="Lives in Pune")
+    new = MemoryObject(key="home_city", value="Lives in Mumbai")
+    store.add(old)
+    store.add(new)
+
+    store.delete(old.memory_id)
+
+    assert store.active_by_key_view()[("home_city", MemoryType.FACT)] is new
+
+
+# Decay
+
+def _decay_run(interval, turns=20, recalls=None):
+    """Heat/status per key after `turns` turns with a pass every `interval`."""
+    recalls = recalls or {}
+    s = MemoryStore(db_path=":memory:")
+    try:
+        for (k, v), heat in zip(FACTS, (0.95, 0.7, 0.5, 0.35, 0.2)):
+            s.add(MemoryObject(memory_id=f"mem_{k}", key=k, value=v, heat=heat))
+        evicted = []
+        for turn in range(1, turns + 1):
+            if turn in recalls:
+                s.mark_recalled_many([f"mem_{k}" for k in recalls[turn]], turn)
+            if turn % interval == 0:
+                evicted += s.apply_decay(turn)
+        live = {m.key: (round(m.heat, 9), m.status) for m in s.get_all_active()}
+        return live, sorted(evicted)
+    finally:
+        s.close()
+
+
+def test_interval_decay_catches_up_to_per_turn_decay():
+    recalls = {3: ["pet"], 14: ["home_city", "diet"], 22: ["pet"]}
+
+    every_turn = _decay_run(interval=1, recalls=recalls)
+    batched    = _decay_run(interval=10, recalls=recalls)
+
+    assert batched == every_turn
+    assert every_turn[0] and every_turn[1]   # some survive, some evicted
+
+
+def test_heat_of_reports_effective_heat(store):
+    mem = MemoryObject(key="home_city", value="Lives in Pune", heat=0.9)
+    store.add(mem)
+
+    heat, _ = store.heat_of([mem.memory_id], upto_turn=5)
+
+    assert heat[0] == pytest.approx(0.9 - 5 * store.HEAT_DECAY_PER_TURN)
+    assert mem.heat == 0.9   # nothing settled until the next pass
+
+
+def test_semantic_search_weights_by_effective_heat(store):
+    store.add(MemoryObject(key="home_city", value="Lives in Pune", heat=0.9))
+
+    [(_, stored)]    = store.semantic_search("Which city do I live in?", threshold=0.0)
+    [(_, effective)] = store.semantic_search("Which city do I live in?", threshold=0.0,
+                                             upto_turn=20)
+
+    raw = stored / (0.7 + 0.3 * 0.9)
+    assert effective == pytest.approx(raw * (0.7 + 0.3 * 0.1))
+
+
+# Background writer
+
+def test_unclosed_warm_tier_is_collected_and_drains(tmp_path):
+    warm = WarmTier(persistence_path=str(tmp_path / "chroma"),
+                    collection_name="mem_gc")
+    warm.upsert(MemoryObject(key="home_city", value="Lives in Pune"))
+    writer, ref = warm._writer, weakref.ref(warm)
+
+    del warm
+    gc.collect()
+
+    assert ref() is None
+    assert not writer.is_alive()
+
+
+# Hot tier
+
+def test_hot_tier_unindexes_evicted_entries():
+    hot  = HotTier()
+    mems = [MemoryObject(key=f"k{i}", value="v") for i in range(hot.HOT_SIZE + 5)]
+    for m in mems:
+        hot.add(m)
+
+    assert len(hot) == hot.HOT_SIZE
+    assert all(hot.find_by_id(m.memory_id) is None for m in mems[:5])
+    assert all(hot.find_by_id(m.memory_id) is m for m in mems[5:])
+    assert len(hot._by_id) == hot.HOT_SIZE
+
+
+def test_hot_tier_keeps_newer_copy_when_older_falls_out():
+    hot   = HotTier()
+    first = MemoryObject(memory_id="mem_same", key="k", value="old")
+    hot.add(first)
+    newer = MemoryObject(memory_id="mem_same", key="k", value="new")
+    hot.add(newer)
+    for i in range(hot.HOT_SIZE - 1):   # pushes only `first` out
+        hot.add(MemoryObject(key=f"k{i}", value="v"))
+
+    assert hot.find_by_id("mem_same") is newer
+
+
+# Cold tier
+
+def test_export_all_matches_to_dict():
+    cold = ColdTier(":memory:")
+    mems = [
+        MemoryObject(key="a", value="x", heat=0.1235, confidence=0.6665),
+        MemoryObject(key="b", value="y", heat=0.2, status=MemoryStatus.DECAYING),
+        MemoryObject(key="c", value="z", heat=1.0, type=MemoryType.CONSTRAINT),
+    ]
+    cold.upsert_many(mems)
+    cold.upsert(MemoryObject(key="gone", value="-", status=MemoryStatus.EVICTED))
+
+    exported = {d["memory_id"]: d for d in cold.export_all()}
+
+    assert exported == {m.memory_id: m.to_dict() for m in mems}